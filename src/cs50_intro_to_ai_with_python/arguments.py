@@ -0,0 +1,15 @@
+"""
+Argument types shared by the command line tools.
+"""
+
+import argparse
+
+
+def positive_int(value):
+    """
+    An argparse type for counts that must be at least 1.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value}")
+    return number
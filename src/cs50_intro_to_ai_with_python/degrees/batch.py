@@ -0,0 +1,161 @@
+"""
+Answers many degrees of separation queries against a single loaded graph.
+
+Each line of input holds a source and a target separated by a tab, and either may be a person's name or IMDB id.
+Queries are grouped by source so one breadth-first search serves all of its targets, and independent sources are
+spread across forked worker processes that share the loaded graph copy-on-write. Answers are streamed to stdout as
+JSON lines as soon as they are found, so each carries the index of the query it answers.
+
+Usage: python -m src.cs50_intro_to_ai_with_python.degrees.batch directory [queries] [--processes N]
+"""
+
+import argparse
+import json
+import sys
+
+from src.cs50_intro_to_ai_with_python.arguments import positive_int
+from src.cs50_intro_to_ai_with_python.degrees import degrees
+from src.cs50_intro_to_ai_with_python.degrees.graph import can_fork, worker_graph
+
+
+def read_queries(lines):
+    """
+    Returns a list of (source, target) pairs from tab separated lines, skipping blank lines.
+    """
+    queries = []
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        fields = line.split("\t")
+        if len(fields) != 2:
+            raise ValueError(
+                f"line {line_number}: expected a source and a target separated by a tab"
+            )
+        queries.append((fields[0].strip(), fields[1].strip()))
+    return queries
+
+
+def group_by_source(queries, graph=None):
+    """
+    Resolves queries against graph (the default degrees graph if None) and groups them by source person.
+
+    Returns (groups, errors) where groups maps each source_id to a list of (index, source, target, target_id) and
+    errors holds a record for every query that could not be resolved, listing the closest matching people as
+    candidates.
+    """
+    graph = graph or degrees.graph
+    groups = {}
+    errors = []
+    for index, (source, target) in enumerate(queries):
+        unresolved = source
+        source_id, error = graph.resolve_person(source)
+        if error is None:
+            unresolved = target
+            target_id, error = graph.resolve_person(target)
+        if error is not None:
+            record = _record(index, source, target, error=error)
+            record["candidates"] = graph.candidate_fields(unresolved)
+            errors.append(record)
+            continue
+        groups.setdefault(source_id, []).append((index, source, target, target_id))
+    return groups, errors
+
+
+def answer_group(group, graph=None):
+    """
+    Answers every query sharing one source with a single search. Returns a list of records.
+    """
+    graph = graph or degrees.graph
+    source_id, queries = group
+    paths = graph.shortest_paths(source_id, {query[3] for query in queries})
+    return [
+        _record(index, source, target, path=paths[target_id])
+        for index, source, target, target_id in queries
+    ]
+
+
+def run_batch(queries, out, processes=None, graph=None):
+    """
+    Answers queries against graph (the default degrees graph if None) and writes one JSON record per query to out,
+    in the order answers become available.
+
+    processes is the number of worker processes (at least 1), defaulting to one per CPU. Workers are forked from the
+    loaded graph so they share it without copying; where fork is unavailable queries are answered in this process.
+    """
+    if processes is not None and processes < 1:
+        raise ValueError(f"processes must be at least 1: {processes}")
+    graph = graph or degrees.graph
+    groups, errors = group_by_source(queries, graph)
+    for record in errors:
+        _write(out, record)
+
+    if not can_fork():
+        processes = 1
+    if processes == 1 or len(groups) < 2:
+        for group in groups.items():
+            _write_all(out, answer_group(group, graph))
+        return
+
+    with graph.process_pool(processes) as pool:
+        for records in pool.imap_unordered(_answer_shared_group, groups.items()):
+            _write_all(out, records)
+
+
+def _answer_shared_group(group):
+    return answer_group(group, worker_graph())
+
+
+def _record(index, source, target, path=None, error=None):
+    record = {"index": index, "source": source, "target": target}
+    if error is not None:
+        record["error"] = error
+    else:
+        record.update(degrees.path_fields(path))
+    return record
+
+
+def _write(out, record):
+    out.write(json.dumps(record) + "\n")
+
+
+def _write_all(out, records):
+    for record in records:
+        _write(out, record)
+    out.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Answer many degrees of separation queries as JSON lines."
+    )
+    parser.add_argument("directory", help="directory holding the CSV files")
+    parser.add_argument(
+        "queries",
+        nargs="?",
+        default="-",
+        help="file of tab separated source and target pairs, or - for stdin",
+    )
+    parser.add_argument(
+        "--processes",
+        type=positive_int,
+        default=None,
+        help="number of worker processes",
+    )
+    args = parser.parse_args()
+
+    print("Loading data...", file=sys.stderr)
+    degrees.load_data(args.directory)
+    print("Data loaded.", file=sys.stderr)
+
+    if args.queries == "-":
+        queries = read_queries(sys.stdin)
+    else:
+        with open(args.queries, encoding="utf-8") as f:
+            queries = read_queries(f)
+
+    run_batch(queries, sys.stdout, processes=args.processes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+Benchmark suite for degrees at production scale.
+
+Loads a dataset, by default one written by generate.py into a temporary directory, and measures the load time, the
+peak memory of the process and the latency percentiles of shortest_path over seeded random pairs of credited people.
+The report is printed as JSON, so runs of different versions or dataset sizes can be compared. With --landmarks, a
+landmark index is built after loading and landmark A* is timed over the same pairs.
+
+Usage: python -m src.cs50_intro_to_ai_with_python.degrees.benchmark [directory] [--people N] [--movies N]
+    [--queries Q] [--seed S] [--parallel] [--landmarks N] [--output FILE]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from src.cs50_intro_to_ai_with_python.arguments import positive_int
+from src.cs50_intro_to_ai_with_python.degrees import generate, landmarks
+from src.cs50_intro_to_ai_with_python.degrees.graph import Graph
+
+PERCENTILES = (50, 90, 99)
+
+
+def measure_load(directory, parallel=False):
+    """
+    Loads the dataset in directory. Returns the graph and a dict of the load time, dataset size and peak memory.
+    """
+    rss_before = peak_rss()
+    started = time.perf_counter()
+    graph = Graph.from_directory(directory, parallel=parallel)
+    seconds = time.perf_counter() - started
+    return graph, {
+        "seconds": round(seconds, 4),
+        "people": len(graph.people),
+        "movies": len(graph.movies),
+        "credits": sum(len(movie["stars"]) for movie in graph.movies.values()),
+        "parallel": parallel,
+        "peak_rss_bytes_before": rss_before,
+        "peak_rss_bytes": peak_rss(),
+        # The largest of the worker processes that parsed people.csv and movies.csv
+        "peak_rss_bytes_workers": peak_rss(children=True) if parallel else None,
+    }
+
+
+def measure_queries(graph, queries, seed=0, shortest_path=None):
+    """
+    Times shortest_path(source, target), graph.shortest_path by default, between queries random pairs of people
+    credited in at least one movie, and returns a dict of the latency percentiles and path lengths.
+    """
+    shortest_path = shortest_path or graph.shortest_path
+    rng = random.Random(seed)
+    # Sorted, so the same seed picks the same pairs whatever order the graph was loaded in
+    credited = sorted(
+        person_id for person_id, person in graph.people.items() if person["movies"]
+    )
+    seconds = []
+    lengths = []
+    for _ in range(queries):
+        source, target = rng.choice(credited), rng.choice(credited)
+        started = time.perf_counter()
+        path = shortest_path(source, target)
+        seconds.append(time.perf_counter() - started)
+        if path is not None:
+            lengths.append(len(path))
+    return {
+        "queries": queries,
+        "connected": len(lengths),
+        "mean_degrees": round(statistics.fmean(lengths), 2) if lengths else None,
+        "max_degrees": max(lengths, default=None),
+        "seconds": {
+            **{f"p{p}": round(percentile(seconds, p), 6) for p in PERCENTILES},
+            "mean": round(statistics.fmean(seconds), 6),
+            "max": round(max(seconds), 6),
+        },
+    }
+
+
+def percentile(values, p):
+    """
+    Returns the p-th percentile of a non-empty list of values by the nearest-rank method.
+    """
+    ordered = sorted(values)
+    rank = max(1, -(-p * len(ordered) // 100))
+    return ordered[rank - 1]
+
+
+def peak_rss(children=False):
+    """
+    Returns the peak resident set size of this process, or with children of its largest finished child process, in
+    bytes, or None where it cannot be measured.
+    """
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure_landmarks(graph, count, queries, seed=0):
+    """
+    Builds a landmark index of count landmarks for the graph, and returns a dict of the build time and the latency
+    of landmark A* over the same pairs as measure_queries.
+    """
+    started = time.perf_counter()
+    index = landmarks.build(graph.people, graph.movies, count=count)
+    seconds = time.perf_counter() - started
+    return {
+        "count": count,
+        "build_seconds": round(seconds, 4),
+        "astar": measure_queries(
+            graph,
+            queries,
+            seed=seed,
+            shortest_path=lambda source, target: landmarks.shortest_path(
+                source, target, graph.people, graph.movies, index
+            ),
+        ),
+    }
+
+
+def run(directory, queries, seed=0, parallel=False, landmark_count=0):
+    """
+    Returns the report of benchmarking the dataset in directory, comparing landmark A* with landmark_count
+    landmarks if it is not zero.
+    """
+    graph, load = measure_load(directory, parallel=parallel)
+    report = {
+        "directory": directory,
+        "seed": seed,
+        "load": load,
+        "shortest_path": measure_queries(graph, queries, seed=seed),
+    }
+    if landmark_count:
+        report["landmarks"] = measure_landmarks(
+            graph, landmark_count, queries, seed=seed
+        )
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark loading and searching degrees."
+    )
+    parser.add_argument(
+        "directory",
+        nargs="?",
+        help="dataset to benchmark (by default a synthetic one generated for the run)",
+    )
+    parser.add_argument(
+        "--people",
+        type=positive_int,
+        default=100_000,
+        help="number of people to generate",
+    )
+    parser.add_argument(
+        "--movies",
+        type=positive_int,
+        default=30_000,
+        help="number of movies to generate",
+    )
+    parser.add_argument(
+        "--queries",
+        type=positive_int,
+        default=200,
+        help="shortest_path queries to time",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="parse people.csv and movies.csv in worker processes",
+    )
+    parser.add_argument(
+        "--landmarks",
+        type=int,
+        default=0,
+        help="also time landmark A* with this many landmarks",
+    )
+    parser.add_argument("--output", help="file to write the JSON report to")
+    args = parser.parse_args()
+
+    if args.directory:
+        report = run(
+            args.directory,
+            args.queries,
+            seed=args.seed,
+            parallel=args.parallel,
+            landmark_count=args.landmarks,
+        )
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            print("Generating data...", file=sys.stderr)
+            started = time.perf_counter()
+            generate.generate(directory, args.people, args.movies, seed=args.seed)
+            seconds = time.perf_counter() - started
+            report = run(
+                directory,
+                args.queries,
+                seed=args.seed,
+                parallel=args.parallel,
+                landmark_count=args.landmarks,
+            )
+        report["directory"] = None
+        report["generate"] = {
+            "people": args.people,
+            "movies": args.movies,
+            "seconds": round(seconds, 4),
+        }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Small client for the degrees query server.
+
+Usage: python -m src.cs50_intro_to_ai_with_python.degrees.client source target [--host H] [--port P | --socket PATH]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+
+
+class DegreesClient:
+    """
+    Sends requests to a DegreesServer over one connection. Requests may be awaited concurrently; responses are
+    matched back to them by id.
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.ids = itertools.count()
+        self.pending = {}
+        self.receiver = asyncio.create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, host="127.0.0.1", port=8050, path=None):
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def request(self, op, **fields):
+        if self.receiver.done():
+            raise ConnectionError("connection to the server is closed")
+        request_id = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        message = {"id": request_id, "op": op, **fields}
+        self.writer.write((json.dumps(message) + "\n").encode("utf-8"))
+        await self.writer.drain()
+        return await future
+
+    async def shortest_path(self, source, target):
+        return await self.request("shortest_path", source=source, target=target)
+
+    async def person_id_for_name(self, name):
+        return await self.request("person_id_for_name", name=name)
+
+    async def search_names(self, query, limit=10):
+        return await self.request("search_names", query=query, limit=limit)
+
+    async def apply_delta(self, directory):
+        return await self.request("apply_delta", directory=directory)
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        self.receiver.cancel()
+
+    async def _receive(self):
+        error = ConnectionError("server closed the connection")
+        try:
+            while line := await self.reader.readline():
+                response = json.loads(line)
+                future = self.pending.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except Exception as e:
+            error = ConnectionError(f"invalid response from server: {e!r}")
+        finally:
+            # However the receiver stops, nothing else will answer the requests still waiting
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self.pending.clear()
+
+
+async def query(source, target, host, port, path):
+    client = await DegreesClient.connect(host=host, port=port, path=path)
+    try:
+        return await client.shortest_path(source, target)
+    finally:
+        await client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query a degrees server.")
+    parser.add_argument("source")
+    parser.add_argument("target")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8050)
+    parser.add_argument("--socket", help="connect to this Unix socket path instead")
+    args = parser.parse_args()
+
+    response = asyncio.run(
+        query(args.source, args.target, args.host, args.port, args.socket)
+    )
+    print(json.dumps(response))
+
+
+if __name__ == "__main__":
+    main()
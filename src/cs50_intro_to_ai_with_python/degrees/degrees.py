@@ -1,54 +1,35 @@
-import csv
 import sys
 
+from src.cs50_intro_to_ai_with_python.degrees import ingest
+from src.cs50_intro_to_ai_with_python.degrees.graph import Graph
+
+# The graph used by the module level functions below. Code that needs more than one dataset, or its own, creates
+# further Graph objects instead.
+graph = Graph()
 
 # Maps names to a set of corresponding person_ids
-names = {}
+names = graph.names
 
 # Maps person_ids to a dictionary of: name, birth, movies (a set of movie_ids)
-people = {}
+people = graph.people
 
 # Maps movie_ids to a dictionary of: title, year, stars (a set of person_ids)
-movies = {}
-
-
-def load_data(directory):
-    """
-    Load data from CSV files into memory.
-    """
-    # Load people
-    with open(f"{directory}/people.csv", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            people[row["id"]] = {
-                "name": row["name"],
-                "birth": row["birth"],
-                "movies": set(),
-            }
-            if row["name"].lower() not in names:
-                names[row["name"].lower()] = {row["id"]}
-            else:
-                names[row["name"].lower()].add(row["id"])
-
-    # Load movies
-    with open(f"{directory}/movies.csv", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            movies[row["id"]] = {
-                "title": row["title"],
-                "year": row["year"],
-                "stars": set(),
-            }
-
-    # Load stars
-    with open(f"{directory}/stars.csv", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            try:
-                people[row["person_id"]]["movies"].add(row["movie_id"])
-                movies[row["movie_id"]]["stars"].add(row["person_id"])
-            except KeyError:
-                pass
+movies = graph.movies
+
+load_data = graph.load_data
+shortest_path = graph.shortest_path
+shortest_paths = graph.shortest_paths
+connected = graph.connected
+component_id = graph.component_id
+component_size = graph.component_size
+degrees_lower_bound = graph.degrees_lower_bound
+person_id_for_name = graph.person_id_for_name
+person_ids_for_name = graph.person_ids_for_name
+resolve_person = graph.resolve_person
+person_candidates = graph.person_candidates
+candidate_fields = graph.candidate_fields
+neighbors_for_person = graph.neighbors_for_person
+iter_neighbors_for_person = graph.iter_neighbors_for_person
 
 
 def main():
@@ -58,7 +39,7 @@ def main():
 
     # Load data from files into memory
     print("Loading data...")
-    load_data(directory)
+    load_data(directory, progress=ingest.print_progress)
     print("Data loaded.")
 
     source = person_id_for_name(input("Name: "))
@@ -83,55 +64,19 @@ def main():
             print(f"{i + 1}: {person1} and {person2} starred in {movie}")
 
 
-def shortest_path(source, target):
+def path_fields(path):
     """
-    Returns the shortest list of (movie_id, person_id) pairs
-    that connect the source to the target.
-
-    If no possible path, returns None.
+    Returns the JSON fields describing a path from shortest_path, or a missing one.
     """
-
-    # TODO
-    raise NotImplementedError
-
-
-def person_id_for_name(name):
-    """
-    Returns the IMDB id for a person's name,
-    resolving ambiguities as needed.
-    """
-    person_ids = list(names.get(name.lower(), set()))
-    if len(person_ids) == 0:
-        return None
-    elif len(person_ids) > 1:
-        print(f"Which '{name}'?")
-        for person_id in person_ids:
-            person = people[person_id]
-            name = person["name"]
-            birth = person["birth"]
-            print(f"ID: {person_id}, Name: {name}, Birth: {birth}")
-        try:
-            person_id = input("Intended Person ID: ")
-            if person_id in person_ids:
-                return person_id
-        except ValueError:
-            pass
-        return None
-    else:
-        return person_ids[0]
-
-
-def neighbors_for_person(person_id):
-    """
-    Returns (movie_id, person_id) pairs for people
-    who starred with a given person.
-    """
-    movie_ids = people[person_id]["movies"]
-    neighbors = set()
-    for movie_id in movie_ids:
-        for person_id in movies[movie_id]["stars"]:
-            neighbors.add((movie_id, person_id))
-    return neighbors
+    if path is None:
+        return {"degrees": None, "path": None}
+    return {
+        "degrees": len(path),
+        "path": [
+            {"movie_id": movie_id, "person_id": person_id}
+            for movie_id, person_id in path
+        ],
+    }
 
 
 if __name__ == "__main__":
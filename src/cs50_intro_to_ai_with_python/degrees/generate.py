@@ -0,0 +1,197 @@
+"""
+Generates a synthetic co-star dataset in the format load_data reads.
+
+Only the small dataset ships with the repository, so this writes people.csv, movies.csv and stars.csv of any size
+for benchmarking. The shape follows the real data: most people are credited once or twice while a few stars have
+long careers, because each person is given a Pareto distributed career weight and casts are drawn in proportion to
+it. Cast sizes are Pareto distributed too, and a movie is only cast from people of working age in its year, so
+careers are bounded in time and distant eras are only connected through long paths. The same seed always writes the
+same files.
+
+Usage: python -m src.cs50_intro_to_ai_with_python.degrees.generate directory [--people N] [--movies N] [--seed S]
+"""
+
+import argparse
+import bisect
+import itertools
+import os
+import random
+import sys
+import time
+
+from src.cs50_intro_to_ai_with_python.arguments import positive_int
+from src.cs50_intro_to_ai_with_python.degrees import ingest
+
+FIRST_YEAR = 1900
+LAST_YEAR = 2023
+
+# People are cast from the year they turn CAREER_START until the year they turn CAREER_END
+CAREER_START = 16
+CAREER_END = 80
+
+# Shapes of the Pareto distributions; smaller exponents give heavier tails
+CAREER_EXPONENT = 1.6
+CAST_EXPONENT = 2.0
+MIN_CAST = 2
+MAX_CAST = 60
+
+# Mean years between a movie's year and LAST_YEAR, so recent years have the most movies
+MOVIE_YEAR_SCALE = 25
+# Fraction of people whose birth year is unknown, written as an empty field as in the real data
+UNKNOWN_BIRTH = 0.3
+
+FIRST_NAMES = (
+    "Ada Alan Alice Amir Ana Anna Ben Carla Chen David Diego Elena Emma Eva Felix Grace Hana Hugo Ines Ivan Jack "
+    "James Jane Joao Julia Kai Kate Leo Lily Lucas Maria Mark Maya Mei Mia Nadia Nina Noah Olga Omar Paul Petra "
+    "Priya Rosa Ruth Sam Sara Sofia Tariq Tom Vera Yuki Zoe"
+).split()
+# Surnames are built from syllables, so a large dataset has few repeated names
+SYLLABLES = (
+    "ba bel ber ca can dor el fer gar hal is ka kin lan ler ma mar mon na nor o ra ren ri ro sa son ta ter "
+    "to va ven wal win ya zan"
+).split()
+ADJECTIVES = (
+    "Silent Broken Golden Last Hidden Lost Dark Bright Wild Distant Crimson Frozen Final Endless Secret Quiet "
+    "Burning Empty Hollow Restless"
+).split()
+NOUNS = (
+    "River Empire City Garden Storm Summer Road Heart Mirror Island Night Winter Kingdom Harbor Promise Shadow "
+    "Horizon Frontier Letter Voyage"
+).split()
+SEQUELS = ("", "", "", "", " II", " III", ": Reckoning", ": The Return")
+
+
+def generate(directory, people=100_000, movies=30_000, seed=0):
+    """
+    Writes people.csv, movies.csv and stars.csv for a synthetic dataset to directory, creating it if needed.
+
+    Returns a dict of the number of people, movies and credits written.
+    """
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+
+    # People are numbered in order of birth, so the people of working age in any year are a contiguous range
+    births = sorted(_birth_year(rng) for _ in range(people))
+    weights = [rng.paretovariate(CAREER_EXPONENT) for _ in range(people)]
+    cumulative_weights = list(itertools.accumulate(weights))
+
+    with open(
+        os.path.join(directory, "people.csv"),
+        "w",
+        encoding="utf-8",
+        newline="",
+        buffering=ingest.BUFFER_SIZE,
+    ) as f:
+        f.write("id,name,birth\n")
+        for index, birth in enumerate(births):
+            known = rng.random() >= UNKNOWN_BIRTH
+            f.write(
+                f"{index + 1},{_quote(_person_name(rng))},{birth if known else ''}\n"
+            )
+
+    credits = 0
+    with (
+        open(
+            os.path.join(directory, "movies.csv"),
+            "w",
+            encoding="utf-8",
+            newline="",
+            buffering=ingest.BUFFER_SIZE,
+        ) as movies_file,
+        open(
+            os.path.join(directory, "stars.csv"),
+            "w",
+            encoding="utf-8",
+            newline="",
+            buffering=ingest.BUFFER_SIZE,
+        ) as stars_file,
+    ):
+        movies_file.write("id,title,year\n")
+        stars_file.write("person_id,movie_id\n")
+        for movie_id in range(1, movies + 1):
+            year = max(
+                FIRST_YEAR, LAST_YEAR - int(rng.expovariate(1 / MOVIE_YEAR_SCALE))
+            )
+            movies_file.write(f"{movie_id},{_quote(_movie_title(rng))},{year}\n")
+
+            # The people old enough and young enough to be cast this year
+            low = bisect.bisect_left(births, year - CAREER_END)
+            high = bisect.bisect_right(births, year - CAREER_START)
+            if low == high:
+                continue
+            cast = _cast(rng, cumulative_weights, low, high)
+            stars_file.writelines(
+                f"{person_index + 1},{movie_id}\n" for person_index in sorted(cast)
+            )
+            credits += len(cast)
+
+    return {"people": people, "movies": movies, "credits": credits}
+
+
+def _cast(rng, cumulative_weights, low, high):
+    """
+    Returns a set of person indexes in the range [low, high), drawn in proportion to their career weights.
+    """
+    size = min(MAX_CAST, int(MIN_CAST * rng.paretovariate(CAST_EXPONENT)), high - low)
+    base = cumulative_weights[low - 1] if low else 0.0
+    span = cumulative_weights[high - 1] - base
+    cast = set()
+    # Stars drawn twice are redrawn, within a bound so a tiny range cannot loop for long
+    for _ in range(size * 4):
+        target = base + rng.random() * span
+        cast.add(
+            min(bisect.bisect_right(cumulative_weights, target, low, high), high - 1)
+        )
+        if len(cast) == size:
+            break
+    return cast
+
+
+def _birth_year(rng):
+    return max(
+        FIRST_YEAR - CAREER_START * 2,
+        LAST_YEAR - CAREER_START - int(rng.expovariate(1 / (MOVIE_YEAR_SCALE + 15))),
+    )
+
+
+def _person_name(rng):
+    surname = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3)))
+    return f"{rng.choice(FIRST_NAMES)} {surname.capitalize()}"
+
+
+def _movie_title(rng):
+    return f"The {rng.choice(ADJECTIVES)} {rng.choice(NOUNS)}{rng.choice(SEQUELS)}"
+
+
+def _quote(text):
+    """
+    Returns text as a quoted CSV field, as names and titles are in the real data.
+    """
+    return '"' + text.replace('"', '""') + '"'
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic co-star dataset for degrees."
+    )
+    parser.add_argument("directory", help="directory to write the CSV files to")
+    parser.add_argument(
+        "--people", type=positive_int, default=100_000, help="number of people"
+    )
+    parser.add_argument(
+        "--movies", type=positive_int, default=30_000, help="number of movies"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    counts = generate(args.directory, args.people, args.movies, args.seed)
+    print(
+        f"Wrote {counts['people']:,} people, {counts['movies']:,} movies and {counts['credits']:,} credits "
+        f"to {args.directory} in {time.perf_counter() - started:.2f}s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,408 @@
+"""
+The co-star graph and the indexes built over it.
+
+A Graph owns one loaded dataset, so several (say small and large) can live in one process. A graph built in a parent
+process is shared read-only with worker processes by forking them after it is loaded: the workers inherit its memory
+copy-on-write, so nothing is pickled or copied per worker.
+"""
+
+import concurrent.futures
+import contextlib
+import gc
+import multiprocessing
+import os
+
+from src.cs50_intro_to_ai_with_python import search
+from src.cs50_intro_to_ai_with_python.degrees import ingest, landmarks
+from src.cs50_intro_to_ai_with_python.degrees.name_index import NameIndex
+from src.cs50_intro_to_ai_with_python.degrees.util import LRUCache, UnionFind
+
+# The graph forked workers answer queries against. It is set just before a pool forks, so the workers of each pool
+# inherit the graph that pool was created for.
+_worker_graph = None
+
+
+class Graph:
+    """
+    Attributes:
+          names: maps lowercased names to a set of corresponding person_ids.
+          people: maps person_ids to a dictionary of: name, birth, movies (a set of movie_ids).
+          movies: maps movie_ids to a dictionary of: title, year, stars (a set of person_ids).
+          neighbor_cache: most recently used neighbour sets, so hub actors are not rebuilt on every expansion.
+          components: connected components of the co-star graph; the root of a person's set is their component id.
+          name_index: prefix and fuzzy index over the keys of names, built the first time it is used.
+          landmark_index: optional landmark distance index persisted next to the CSV files, giving degrees_lower_bound.
+    """
+
+    # People credited in at least this many movies are expanded from neighbor_cache,
+    # since almost every search (and every batch or server query) passes through them
+    hub_movie_count = 50
+
+    def __init__(self, neighbor_cache_size=1024):
+        self.names = {}
+        self.people = {}
+        self.movies = {}
+        self.neighbor_cache = LRUCache(maxsize=neighbor_cache_size)
+        self.components = UnionFind()
+        self._name_index = None
+        self.landmark_index = None
+
+    @classmethod
+    def from_directory(cls, directory, progress=None, parallel=False):
+        graph = cls()
+        graph.load_data(directory, progress=progress, parallel=parallel)
+        return graph
+
+    def load_data(self, directory, progress=None, parallel=False):
+        """
+        Load data from CSV files into memory.
+
+        progress is called as progress(filename, rows, seconds) after each file,
+        and parallel parses people.csv and movies.csv in worker processes, see ingest.py.
+        """
+        self.neighbor_cache.clear()
+
+        # Load people, movies and stars
+        ingest.read_directory(
+            directory,
+            self.people,
+            self.names,
+            self.movies,
+            progress=progress,
+            parallel=parallel,
+        )
+
+        # Building the name index takes seconds on a large dataset and most loads never search by name,
+        # so it is rebuilt from names when next used
+        self._name_index = None
+
+        # Label connected components, so disconnected queries are answered without searching
+        components = self.components
+        components.clear()
+        for person_id in self.people:
+            components.add(person_id)
+        for movie in self.movies.values():
+            stars = iter(movie["stars"])
+            first = next(stars, None)
+            for person_id in stars:
+                components.union(first, person_id)
+        for person_id in self.people:
+            components.find(person_id)
+
+        # Load the landmark index, if one has been built for this version of the directory
+        self.landmark_index = landmarks.load(directory, person_count=len(self.people))
+
+    def shortest_path(self, source, target):
+        """
+        Returns the shortest list of (movie_id, person_id) pairs
+        that connect the source to the target.
+
+        If no possible path, returns None.
+        """
+        if not self.connected(source, target):
+            return None
+        # Co-starring is symmetric, so both ends search the same neighbours, each skipping its own expanded movies
+        return search.bidirectional(
+            source,
+            target,
+            self._search_neighbors(),
+            reverse_neighbors=self._search_neighbors(),
+        )
+
+    def shortest_paths(self, source, targets):
+        """
+        Returns a dict mapping each of targets to the shortest list of
+        (movie_id, person_id) pairs that connect the source to it.
+
+        A single breadth-first search serves every target and stops as soon as
+        all of them have been reached. Unreachable targets map to None.
+        """
+        paths = {target: None for target in targets}
+        remaining = {target for target in paths if self.connected(source, target)}
+        if source in remaining:
+            paths[source] = []
+            remaining.discard(source)
+        if not remaining:
+            return paths
+
+        for node in search.breadth_first_goals(
+            source, remaining.__contains__, self._search_neighbors()
+        ):
+            paths[node.state] = search.path_to(node)
+            remaining.discard(node.state)
+            if not remaining:
+                break
+
+        return paths
+
+    def _search_neighbors(self):
+        """
+        Returns a neighbors function for one search. A movie's whole cast is reached the first time it is expanded,
+        so it never needs expanding again.
+        """
+        expanded_movies = set()
+        return lambda person_id: self.iter_neighbors_for_person(
+            person_id, expanded_movies
+        )
+
+    def connected(self, source, target):
+        """
+        Returns True if source and target are in the same connected component.
+        """
+        return self.components.find(source) == self.components.find(target)
+
+    def component_id(self, person_id):
+        """
+        Returns the id of the connected component containing a person.
+        """
+        return self.components.find(person_id)
+
+    def component_size(self, person_id):
+        """
+        Returns the number of people in the connected component containing a person.
+        """
+        return self.components.set_size(person_id)
+
+    def degrees_lower_bound(self, source, target):
+        """
+        Returns a lower bound on the degrees of separation between source and target
+        from the landmark index (math.inf if they cannot be connected), or None if no
+        index is loaded.
+        """
+        if self.landmark_index is None:
+            return None
+        return self.landmark_index.lower_bound(source, target)
+
+    def person_id_for_name(self, name):
+        """
+        Returns the IMDB id for a person's name,
+        resolving ambiguities as needed.
+        """
+        person_ids = self.person_ids_for_name(name)
+        if len(person_ids) == 0:
+            return None
+        elif len(person_ids) > 1:
+            print(f"Which '{name}'?")
+            for person_id in person_ids:
+                person = self.people[person_id]
+                name = person["name"]
+                birth = person["birth"]
+                print(f"ID: {person_id}, Name: {name}, Birth: {birth}")
+            try:
+                person_id = input("Intended Person ID: ")
+                if person_id in person_ids:
+                    return person_id
+            except ValueError:
+                pass
+            return None
+        else:
+            return person_ids[0]
+
+    def person_ids_for_name(self, name):
+        """
+        Returns a list of every IMDB id matching a person's name,
+        without prompting to resolve ambiguities.
+        """
+        return list(self.names.get(name.lower(), set()))
+
+    def resolve_person(self, value):
+        """
+        Returns (person_id, error) for a name or IMDB id. Ambiguous names are reported as errors rather than
+        prompted for.
+        """
+        if value in self.people:
+            return value, None
+        person_ids = self.person_ids_for_name(value)
+        if len(person_ids) == 0:
+            return None, "person not found"
+        if len(person_ids) > 1:
+            return None, f"ambiguous name, candidates: {', '.join(sorted(person_ids))}"
+        return person_ids[0], None
+
+    @property
+    def name_index(self):
+        return self.build_name_index()
+
+    def build_name_index(self):
+        """
+        Returns the name index, building it from names if it has not been built since the last load.
+        """
+        if self._name_index is None:
+            self._name_index = NameIndex(self.names)
+        return self._name_index
+
+    def index_name(self, key):
+        """
+        Adds a lowercased name to the name index. Until the index is built there is nothing to do, since it is built
+        from names.
+        """
+        if self._name_index is not None:
+            self._name_index.add(key)
+
+    def unindex_name(self, key):
+        """
+        Removes a lowercased name that nobody has any longer from the name index, if it has been built.
+        """
+        if self._name_index is not None:
+            self._name_index.remove(key)
+
+    def person_candidates(self, name, limit=10):
+        """
+        Returns up to limit IMDB ids of people whose names match name exactly,
+        by prefix or approximately, best matches first, without prompting.
+        """
+        candidates = []
+        for key in self.name_index.search(name, limit):
+            candidates.extend(sorted(self.names.get(key, ())))
+        return candidates[:limit]
+
+    def candidate_fields(self, name, limit=10):
+        """
+        Returns the JSON description of the candidates for a name that did not resolve.
+        """
+        return [
+            {
+                "person_id": person_id,
+                "name": self.people[person_id]["name"],
+                "birth": self.people[person_id]["birth"],
+            }
+            for person_id in self.person_candidates(name, limit)
+        ]
+
+    def neighbors_for_person(self, person_id):
+        """
+        Returns (movie_id, person_id) pairs for people
+        who starred with a given person.
+
+        Results are cached for recently used people, so the returned set is frozen.
+        """
+        neighbors = self.neighbor_cache.get(person_id)
+        if neighbors is None:
+            neighbors = frozenset(
+                self._iter_neighbors(self.people[person_id]["movies"])
+            )
+            self.neighbor_cache.put(person_id, neighbors)
+        return neighbors
+
+    def iter_neighbors_for_person(self, person_id, expanded_movies=None):
+        """
+        Lazily yields (movie_id, person_id) pairs for people
+        who starred with a given person.
+
+        If expanded_movies is given, movies already in it are skipped and every
+        movie visited is added to it, so each movie is only expanded once per search.
+        Hub actors are served from the neighbour cache instead of being rebuilt.
+        """
+        movie_ids = self.people[person_id]["movies"]
+        if expanded_movies is None:
+            if len(movie_ids) >= self.hub_movie_count:
+                return iter(self.neighbors_for_person(person_id))
+            return self._iter_neighbors(movie_ids)
+
+        if len(movie_ids) >= self.hub_movie_count:
+            new_movies = movie_ids - expanded_movies
+            expanded_movies.update(new_movies)
+            return (
+                neighbor
+                for neighbor in self.neighbors_for_person(person_id)
+                if neighbor[0] in new_movies
+            )
+        return self._iter_unexpanded_neighbors(movie_ids, expanded_movies)
+
+    def _iter_neighbors(self, movie_ids):
+        movies = self.movies
+        for movie_id in movie_ids:
+            for star_id in movies[movie_id]["stars"]:
+                yield movie_id, star_id
+
+    def _iter_unexpanded_neighbors(self, movie_ids, expanded_movies):
+        movies = self.movies
+        for movie_id in movie_ids:
+            if movie_id in expanded_movies:
+                continue
+            expanded_movies.add(movie_id)
+            for star_id in movies[movie_id]["stars"]:
+                yield movie_id, star_id
+
+    def process_pool(self, processes=None):
+        """
+        Returns a multiprocessing pool whose workers are forked now and share this graph, see worker_graph.
+        """
+        with self._sharing_with_workers():
+            return multiprocessing.get_context("fork").Pool(processes)
+
+    def process_executor(self, max_workers=None, close_fds=()):
+        """
+        Returns a process pool executor whose workers are forked now and share this graph, see worker_graph.
+
+        The name index is built first, so the workers share it rather than each building their own, and the workers
+        are started before returning. Forked from inside a running server, they would inherit (and hold open) every
+        socket the server has open at that moment, so each worker closes the file descriptors in close_fds as it
+        starts.
+        """
+        self.build_name_index()
+        with self._sharing_with_workers():
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_close_fds,
+                initargs=(tuple(close_fds),),
+            )
+            # A fork executor starts all its workers on the first submit
+            executor.submit(_warm_up).result()
+        return executor
+
+    @contextlib.contextmanager
+    def _sharing_with_workers(self):
+        """
+        Makes this the graph of the workers forked inside the block.
+
+        Every object is frozen while they fork, so the garbage collector in a worker never touches (and so copies) the
+        inherited graph. Workers keep the frozen generation they were forked with; this process unfreezes it after
+        the block, so its own garbage is collected as before.
+        """
+        global _worker_graph
+        _worker_graph = self
+        gc.freeze()
+        try:
+            yield
+        finally:
+            gc.unfreeze()
+
+
+def can_fork():
+    """
+    Returns True if worker processes can be forked to share a graph on this platform.
+    """
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def worker_graph():
+    """
+    Returns the graph a forked worker process shares with its parent.
+    """
+    return _worker_graph
+
+
+def worker_shortest_path(source, target):
+    """
+    Graph.shortest_path on the shared graph, for submitting to a process_executor.
+    """
+    return _worker_graph.shortest_path(source, target)
+
+
+def worker_candidate_fields(name, limit=10):
+    """
+    Graph.candidate_fields on the shared graph, for submitting to a process_executor.
+    """
+    return _worker_graph.candidate_fields(name, limit)
+
+
+def _close_fds(fds):
+    for fd in fds:
+        with contextlib.suppress(OSError):
+            os.close(fd)
+
+
+def _warm_up():
+    pass
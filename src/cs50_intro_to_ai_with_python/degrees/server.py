@@ -0,0 +1,297 @@
+"""
+Resident degrees query server.
+
+Loads the graph once and answers requests over a local TCP or Unix socket. The protocol is one JSON object per line
+in each direction; every request may carry an "id" that is echoed back, since answers to concurrent requests on one
+connection arrive in the order they finish:
+
+    {"id": 1, "op": "shortest_path", "source": "Kevin Bacon", "target": "158"}
+    {"id": 2, "op": "person_id_for_name", "name": "Kevin Bacon"}
+    {"id": 3, "op": "search_names", "query": "kevin bac", "limit": 10}
+    {"id": 4, "op": "apply_delta", "directory": "path/to/delta"}
+
+Searches, including the fuzzy name searches behind search_names and unresolved names, run on a pool of worker
+processes forked after the graph is loaded, so the event loop stays responsive while they work, and recent answers are
+cached. apply_delta applies a delta directory to the loaded graph (see update.py) once the searches in progress
+finish, then forks a new pool that shares the updated graph.
+
+Usage: python -m src.cs50_intro_to_ai_with_python.degrees.server directory [--host H] [--port P | --socket PATH]
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import contextlib
+import json
+import os
+import sys
+
+from src.cs50_intro_to_ai_with_python.degrees import degrees, update
+from src.cs50_intro_to_ai_with_python.degrees.graph import (
+    Graph,
+    can_fork,
+    worker_candidate_fields,
+    worker_shortest_path,
+)
+from src.cs50_intro_to_ai_with_python.degrees.util import LRUCache
+
+
+class DegreesServer:
+    """
+    Answers shortest_path, person_id_for_name, search_names and apply_delta requests against a loaded graph, by
+    default the degrees module's.
+
+    executor runs the path and name searches. By default it is the graph's process executor, whose workers are forked
+    before the server opens any socket and share the graph; a thread pool is used where fork is unavailable. A given
+    executor is handed the graph's methods directly, so it should be a thread pool.
+    """
+
+    def __init__(self, graph=None, executor=None, cache_size=4096):
+        self.graph = graph or degrees.graph
+        # Whether executor is a pool of workers forked to share the graph, which must be forked again after updates
+        self.forked = executor is None and can_fork()
+        if self.forked:
+            executor = self.graph.process_executor()
+            self.search = worker_shortest_path
+            self.candidate_fields = worker_candidate_fields
+        else:
+            executor = executor or concurrent.futures.ThreadPoolExecutor()
+            self.search = self.graph.shortest_path
+            self.candidate_fields = self.graph.candidate_fields
+        self.executor = executor
+        self.cache = LRUCache(maxsize=cache_size)
+        self.server = None
+        # The writers of the open connections
+        self.connections = set()
+        # Searches in progress, and whether an update is waiting for them to finish
+        self.searches = 0
+        self.updating = False
+        self.condition = asyncio.Condition()
+
+    async def start(self, host="127.0.0.1", port=0, path=None):
+        """
+        Starts listening on a Unix socket at path if given, otherwise on host and port. Port 0 picks a free port.
+        """
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self.handle_client, path=path)
+        else:
+            self.server = await asyncio.start_server(self.handle_client, host, port)
+        return self.server
+
+    @property
+    def address(self):
+        return self.server.sockets[0].getsockname()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def handle_client(self, reader, writer):
+        lock = asyncio.Lock()
+        tasks = set()
+        self.connections.add(writer)
+        try:
+            while line := await reader.readline():
+                task = asyncio.create_task(self._respond(line, writer, lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except ConnectionError:
+            pass
+        finally:
+            self.connections.discard(writer)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _respond(self, line, writer, lock):
+        response = await self.handle_request(line)
+        async with lock:
+            with contextlib.suppress(ConnectionError):
+                writer.write((json.dumps(response) + "\n").encode("utf-8"))
+                await writer.drain()
+
+    async def handle_request(self, line):
+        """
+        Returns the response for one encoded request. Every failure is reported as an error field rather than raised.
+        """
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {"id": None, "error": "invalid JSON"}
+        if not isinstance(request, dict):
+            return {"id": None, "error": "request must be a JSON object"}
+
+        response = {"id": request.get("id")}
+        op = request.get("op")
+        try:
+            if op == "shortest_path":
+                response.update(
+                    await self.shortest_path(
+                        _string_field(request, "source"),
+                        _string_field(request, "target"),
+                    )
+                )
+            elif op == "person_id_for_name":
+                response["person_ids"] = sorted(
+                    self.graph.person_ids_for_name(_string_field(request, "name"))
+                )
+            elif op == "search_names":
+                response["candidates"] = await self.run_search(
+                    self.candidate_fields,
+                    _string_field(request, "query"),
+                    _limit_field(request),
+                )
+            elif op == "apply_delta":
+                response["applied"] = await self.apply_delta(
+                    _string_field(request, "directory")
+                )
+            else:
+                response["error"] = f"unknown op: {op}"
+        except ValueError as e:
+            response["error"] = str(e)
+        except Exception as e:
+            response["error"] = f"{op} failed: {e!r}"
+        return response
+
+    async def shortest_path(self, source, target):
+        """
+        Returns the path fields for a source and target given as names or IMDB ids, or an error field.
+        """
+        unresolved = source
+        source_id, error = self.graph.resolve_person(source)
+        if error is None:
+            unresolved = target
+            target_id, error = self.graph.resolve_person(target)
+        if error is not None:
+            return {
+                "error": error,
+                "candidates": await self.run_search(self.candidate_fields, unresolved),
+            }
+
+        key = (source_id, target_id)
+        fields = self.cache.get(key)
+        if fields is None:
+            path = await self.run_search(self.search, source_id, target_id)
+            fields = degrees.path_fields(path)
+            self.cache.put(key, fields)
+        return fields
+
+    async def run_search(self, function, *args):
+        """
+        Returns function(*args) run on the executor, waiting first for any update to finish.
+        """
+        async with self.condition:
+            await self.condition.wait_for(lambda: not self.updating)
+            self.searches += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, function, *args)
+        finally:
+            async with self.condition:
+                self.searches -= 1
+                self.condition.notify_all()
+
+    async def apply_delta(self, directory):
+        """
+        Applies the delta CSV files in directory to the graph and returns the counts applied.
+
+        New searches wait while the ones in progress finish, so none reads the graph while it changes, and the
+        cached answers are dropped. Forked workers hold a copy of the graph from when they were forked, so they are
+        replaced by new ones, which close the server's sockets they inherit.
+        """
+        async with self.condition:
+            await self.condition.wait_for(lambda: not self.updating)
+            self.updating = True
+            await self.condition.wait_for(lambda: self.searches == 0)
+        try:
+            if not os.path.isdir(directory):
+                raise ValueError(f"not a directory: {directory}")
+            counts = update.apply_delta(self.graph, directory)
+            self.cache.clear()
+            if self.forked:
+                # No search is running, so the old pool stops at once; its threads must be gone before forking
+                self.executor.shutdown(wait=True)
+                self.executor = self.graph.process_executor(
+                    close_fds=self._socket_fds()
+                )
+            return counts
+        finally:
+            async with self.condition:
+                self.updating = False
+                self.condition.notify_all()
+
+    def _socket_fds(self):
+        """
+        Returns the file descriptors of the listening sockets and open connections.
+        """
+        sockets = list(self.server.sockets) if self.server is not None else []
+        sockets.extend(writer.get_extra_info("socket") for writer in self.connections)
+        return [sock.fileno() for sock in sockets if sock is not None]
+
+
+def _string_field(request, name):
+    if name not in request:
+        raise ValueError(f"missing field: {name}")
+    value = request[name]
+    if not isinstance(value, str):
+        raise ValueError(f"field must be a string: {name}")
+    return value
+
+
+def _limit_field(request):
+    limit = request.get("limit", 10)
+    if not isinstance(limit, int) or isinstance(limit, bool) or not 1 <= limit <= 100:
+        raise ValueError("field must be an integer from 1 to 100: limit")
+    return limit
+
+
+@contextlib.asynccontextmanager
+async def local_server(directory=None, executor=None, graph=None):
+    """
+    Runs a server on a free localhost port inside the current event loop and yields it, for tests and scripts that
+    need one without any external services. Serves a new graph loaded from directory if given.
+    """
+    if directory is not None:
+        graph = Graph.from_directory(directory)
+    server = DegreesServer(graph=graph, executor=executor)
+    await server.start()
+    try:
+        yield server
+    finally:
+        await server.close()
+
+
+async def serve(graph, host, port, path):
+    server = DegreesServer(graph=graph)
+    await server.start(host=host, port=port, path=path)
+    print(f"Serving on {path or server.address}", file=sys.stderr)
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve degrees of separation queries.")
+    parser.add_argument("directory", help="directory holding the CSV files")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8050)
+    parser.add_argument("--socket", help="listen on this Unix socket path instead")
+    args = parser.parse_args()
+
+    print("Loading data...", file=sys.stderr)
+    graph = Graph.from_directory(args.directory)
+    print("Data loaded.", file=sys.stderr)
+
+    try:
+        asyncio.run(serve(graph, args.host, args.port, args.socket))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
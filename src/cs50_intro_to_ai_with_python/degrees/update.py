@@ -0,0 +1,214 @@
+"""
+Incremental dataset updates for degrees.
+
+A delta directory holds any of people.csv, movies.csv and stars.csv in the same format as the full dataset, with
+only the new or changed rows. apply_delta applies it to an already loaded Graph, touching only the affected
+adjacency, name, name index, component and landmark index entries, so a refresh takes time proportional to the
+delta.
+
+A running server takes a delta with its apply_delta op. The command line form appends the delta rows to the
+dataset's CSV files, so the next full load sees the same graph. That takes time proportional to the delta too, unless
+the dataset has a landmark index: the index is then brought up to date by loading the dataset and applying the delta
+to it, since an index that no longer matches the CSV files is ignored.
+
+Usage: python -m src.cs50_intro_to_ai_with_python.degrees.update directory delta_directory
+"""
+
+import argparse
+import csv
+import os
+import sys
+
+from src.cs50_intro_to_ai_with_python.degrees import ingest, landmarks
+from src.cs50_intro_to_ai_with_python.degrees.graph import Graph
+
+CSV_FILENAMES = ("people.csv", "movies.csv", "stars.csv")
+
+
+def apply_delta(graph, directory):
+    """
+    Applies the delta CSV files in directory to a loaded Graph.
+
+    Existing people and movies are updated in place, new ones are added, and credits for unknown ids are skipped.
+    Returns a dict counting the people, movies and credits added or updated.
+    """
+    counts = {"people": 0, "movies": 0, "credits": 0}
+
+    path = os.path.join(directory, "people.csv")
+    if os.path.exists(path):
+        new_people, _, _, _ = ingest.read_people(path)
+        counts["people"] = add_people(graph, new_people)
+
+    path = os.path.join(directory, "movies.csv")
+    if os.path.exists(path):
+        new_movies, _, _ = ingest.read_movies(path)
+        counts["movies"] = add_movies(graph, new_movies)
+
+    path = os.path.join(directory, "stars.csv")
+    if os.path.exists(path):
+        counts["credits"] = add_credits(graph, ingest.read_credits(path))
+
+    return counts
+
+
+def add_people(graph, new_people):
+    """
+    Adds or updates people, given as person_id mapped to a dict of name and birth. Returns how many were applied.
+    """
+    added = []
+    for person_id, person in new_people.items():
+        existing = graph.people.get(person_id)
+        if existing is None:
+            graph.people[person_id] = {
+                "name": person["name"],
+                "birth": person["birth"],
+                "movies": set(),
+            }
+            graph.components.add(person_id)
+            added.append(person_id)
+        else:
+            _discard_name(graph, existing["name"].lower(), person_id)
+            existing["name"] = person["name"]
+            existing["birth"] = person["birth"]
+        graph.names.setdefault(person["name"].lower(), set()).add(person_id)
+        graph.index_name(person["name"].lower())
+
+    if graph.landmark_index is not None:
+        graph.landmark_index.add_people(added)
+    return len(new_people)
+
+
+def _discard_name(graph, key, person_id):
+    """
+    Removes a person from a lowercased name, dropping the name once nobody has it.
+    """
+    person_ids = graph.names.get(key)
+    if person_ids is None:
+        return
+    person_ids.discard(person_id)
+    if not person_ids:
+        del graph.names[key]
+        graph.unindex_name(key)
+
+
+def add_movies(graph, new_movies):
+    """
+    Adds or updates movies, given as movie_id mapped to a dict of title and year. Returns how many were applied.
+    """
+    for movie_id, movie in new_movies.items():
+        existing = graph.movies.get(movie_id)
+        if existing is None:
+            graph.movies[movie_id] = {
+                "title": movie["title"],
+                "year": movie["year"],
+                "stars": set(),
+            }
+        else:
+            existing["title"] = movie["title"]
+            existing["year"] = movie["year"]
+    return len(new_movies)
+
+
+def add_credits(graph, credits):
+    """
+    Adds (person_id, movie_id) credits, skipping unknown ids and credits already present. Returns how many were added.
+    """
+    added = []
+    for person_id, movie_id in credits:
+        person = graph.people.get(person_id)
+        movie = graph.movies.get(movie_id)
+        if person is None or movie is None or movie_id in person["movies"]:
+            continue
+
+        # The new star and everyone already in the movie gain neighbours
+        graph.neighbor_cache.discard(person_id)
+        for star_id in movie["stars"]:
+            graph.neighbor_cache.discard(star_id)
+            graph.components.union(person_id, star_id)
+
+        person["movies"].add(movie_id)
+        movie["stars"].add(person_id)
+        added.append((person_id, movie_id))
+
+    if added and graph.landmark_index is not None:
+        graph.landmark_index.add_credits(added, graph.people, graph.movies)
+    return len(added)
+
+
+def append_to_dataset(dataset_directory, delta_directory):
+    """
+    Appends the rows of each delta CSV file to the matching file in the dataset directory. Returns a dict counting
+    the lines appended to each file.
+
+    Raises ValueError, before appending anything, if a delta file's header differs from the dataset file's, since
+    its rows would be read with the wrong columns.
+    """
+    deltas = {}
+    for filename in CSV_FILENAMES:
+        delta_path = os.path.join(delta_directory, filename)
+        if not os.path.exists(delta_path):
+            continue
+        with open(delta_path, encoding="utf-8", newline="") as delta:
+            header = next(csv.reader(delta), None)
+            rows = delta.read()
+        dataset_header = _read_header(os.path.join(dataset_directory, filename))
+        if header is not None and header != dataset_header:
+            raise ValueError(
+                f"{filename}: delta columns {header} do not match the dataset's {dataset_header}"
+            )
+        deltas[filename] = rows
+
+    counts = {}
+    for filename, rows in deltas.items():
+        if rows and not rows.endswith("\n"):
+            rows += "\n"
+        counts[filename] = rows.count("\n")
+        if not rows:
+            continue
+        dataset_path = os.path.join(dataset_directory, filename)
+        with open(dataset_path, "rb+") as f:
+            # Make sure the appended rows start on a line of their own
+            f.seek(0, os.SEEK_END)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write(rows.encode("utf-8"))
+    return counts
+
+
+def _read_header(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return next(csv.reader(f), None)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Apply delta CSV files to a degrees dataset."
+    )
+    parser.add_argument("directory", help="directory holding the dataset CSV files")
+    parser.add_argument("delta", help="directory holding the delta CSV files")
+    args = parser.parse_args()
+
+    try:
+        if landmarks.load(args.directory) is None:
+            counts = append_to_dataset(args.directory, args.delta)
+        else:
+            # The landmark index has to be updated as well, which needs the whole graph
+            print("Loading data...", file=sys.stderr)
+            graph = Graph.from_directory(args.directory, progress=ingest.print_progress)
+            counts = append_to_dataset(args.directory, args.delta)
+            apply_delta(graph, args.delta)
+            graph.landmark_index.save(args.directory)
+    except ValueError as e:
+        parser.error(str(e))
+    print(
+        "Appended "
+        + ", ".join(f"{rows} rows to {filename}" for filename, rows in counts.items())
+        + ".",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
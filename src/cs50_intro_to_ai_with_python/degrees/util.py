@@ -1,37 +1,85 @@
-class Node:
-    def __init__(self, state, parent, action):
-        self.state = state
-        self.parent = parent
-        self.action = action
+from collections import OrderedDict
 
+# The search nodes and frontiers are shared with the maze project
+from src.cs50_intro_to_ai_with_python.search import (  # noqa: F401 (re-exported)
+    Node,
+    StackFrontier,
+    QueueFrontier,
+)
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache. Once more than maxsize keys are cached the least recently used entry is dropped.
+
+    Used to keep the neighbour sets of hub actors around, so tens of thousands of (movie_id, person_id) tuples are not
+    rebuilt on every visit, and to remember recent query answers.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+
+    def get(self, key, default=None):
+        if key not in self.entries:
+            return default
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def discard(self, key):
+        self.entries.pop(key, None)
+
+    def clear(self):
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class UnionFind:
+    """
+    Disjoint sets with union by size and path compression, so finding a set's root is effectively constant time.
+
+    Used to label the connected components of the co-star graph: the root of a person's set is their component id.
+    """
 
-class StackFrontier:
     def __init__(self):
-        self.frontier = []
-
-    def add(self, node):
-        self.frontier.append(node)
-
-    def contains_state(self, state):
-        return any(node.state == state for node in self.frontier)
-
-    def empty(self):
-        return len(self.frontier) == 0
-
-    def remove(self):
-        if self.empty():
-            raise Exception("empty frontier")
-        else:
-            node = self.frontier[-1]
-            self.frontier = self.frontier[:-1]
-            return node
-
-
-class QueueFrontier(StackFrontier):
-    def remove(self):
-        if self.empty():
-            raise Exception("empty frontier")
-        else:
-            node = self.frontier[0]
-            self.frontier = self.frontier[1:]
-            return node
+        self.parent = {}
+        self.size = {}
+
+    def add(self, item):
+        if item not in self.parent:
+            self.parent[item] = item
+            self.size[item] = 1
+
+    def find(self, item):
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a, b):
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size.pop(root_b)
+        return root_a
+
+    def set_size(self, item):
+        return self.size[self.find(item)]
+
+    def clear(self):
+        self.parent.clear()
+        self.size.clear()
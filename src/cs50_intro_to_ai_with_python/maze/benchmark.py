@@ -0,0 +1,105 @@
+"""
+Startup benchmark for the maze module.
+
+Measures what a short-lived worker process pays to use it: the cold import time of the module in fresh interpreters,
+whether importing it pulls in PIL or configures logging, and the time to load and silently solve each maze. The
+report is printed as JSON.
+
+Usage: python -m src.cs50_intro_to_ai_with_python.maze.benchmark [--runs N] [maze ...]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from src.cs50_intro_to_ai_with_python.arguments import positive_int
+from src.cs50_intro_to_ai_with_python.maze.maze import Maze
+
+MODULE = "src.cs50_intro_to_ai_with_python.maze.maze"
+
+MAZE_DIRECTORY = os.path.dirname(__file__)
+
+# Run in a fresh interpreter: times the import and reports what it loaded
+IMPORT_PROBE = f"""
+import json, logging, sys, time
+started = time.perf_counter()
+import {MODULE}
+seconds = time.perf_counter() - started
+print(json.dumps({{
+    "seconds": seconds,
+    "pil_imported": "PIL" in sys.modules,
+    "logging_configured": bool(logging.getLogger().handlers),
+}}))
+"""
+
+
+def measure_import(runs):
+    """
+    Imports the maze module in runs fresh interpreters and returns a dict of the import times and side effects.
+    """
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_PROBE],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        samples.append(json.loads(output))
+    seconds = [sample["seconds"] for sample in samples]
+    return {
+        "runs": runs,
+        "median_seconds": round(statistics.median(seconds), 6),
+        "min_seconds": round(min(seconds), 6),
+        "pil_imported": any(sample["pil_imported"] for sample in samples),
+        "logging_configured": any(sample["logging_configured"] for sample in samples),
+    }
+
+
+def measure_solve(filename, runs):
+    """
+    Loads and silently solves a maze runs times and returns a dict of the times and states explored.
+    """
+    seconds = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        maze = Maze(filename)
+        maze.solve(animate=False)
+        seconds.append(time.perf_counter() - started)
+    return {
+        "maze": os.path.basename(filename),
+        "states_explored": maze.num_of_states_explored,
+        "solution_length": len(maze.solution[0]),
+        "median_seconds": round(statistics.median(seconds), 6),
+        "min_seconds": round(min(seconds), 6),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure maze import and solve times.")
+    parser.add_argument(
+        "--runs", type=positive_int, default=10, help="runs of each measurement"
+    )
+    parser.add_argument(
+        "mazes",
+        nargs="*",
+        help="maze files to solve (by default the mazes next to this module)",
+    )
+    args = parser.parse_args()
+
+    mazes = args.mazes or [
+        os.path.join(MAZE_DIRECTORY, f"maze{number}.txt") for number in (1, 2, 3)
+    ]
+    report = {
+        "import": measure_import(args.runs),
+        "solve": [measure_solve(filename, args.runs) for filename in mazes],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
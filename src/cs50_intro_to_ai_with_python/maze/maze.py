@@ -1,117 +1,24 @@
 import sys
 import logging
 import time
-from pprint import pformat, pprint
-
-from PIL import Image, ImageDraw
-from abc import (
-    ABC,
-    abstractmethod,
-)  # ABC is a package that provides abstract base classes.
 
 from src.cs50_intro_to_ai_with_python.maze.error_messages import (
     EXACTLY_ONE_START_POINT,
     EXACTLY_ONE_GOAL,
     NO_SOLUTION,
-    EMPTY_FRONTIER,
+)
+from src.cs50_intro_to_ai_with_python.search import (  # noqa: F401 (re-exported)
+    Node,
+    Frontier,
+    StackFrontier,
+    QueueFrontier,
+    depth_first,
 )
 
 from src.cs50_intro_to_ai_with_python.directions import Direction
 
 UP, DOWN, LEFT, RIGHT = Direction
 
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
-)
-
-
-class Node:
-    """
-    In search algorithms nodes represent the individual states that are explored during the search process.  A node
-    is a fundamental unit in search algorithms and encapsulated information about a particular state in the search space.
-
-    Attributes:
-          state: a tuple representing the position of the node in search space.  In this case it is a position within
-          a maze.
-          parent: The parent, or preceding, node in the search tree.  A Node can have only one parent but can be the
-          parent of many node.
-          action:  a List of possible actions, or moves, that can be taken from this state.
-
-    """
-
-    def __init__(self, state, parent, action):
-        self.state = state
-        self.parent = parent
-        self.action = action
-
-    def __repr__(self):
-        return f"Node(state={self.state}, parent={repr(self.parent)}, action={self.action})"
-
-
-class Frontier(ABC):
-    """
-    Abstract base class for frontiers.
-    Inherits from ABC to mark it as an abstract class and allow the use of the @abstractmethod decorator. If the class
-    did not inherit from ABC then the @abstractmethod decorator would not be honoured.
-
-    This class is used to represent the frontier of the search algorithm, i.e. the next nodes to be explored.
-    """
-
-    def __init__(self):
-        self.frontier = []
-
-    def log_attributes(self):
-        logging.info("%s attributes: %s", self.__class__.__name__, pformat(vars(self)))
-
-    def __repr__(self):
-        # Define a meaningful representation for the object
-        logging.info("Node attributes: %s", pformat(vars(self)))
-        return f"Node({vars(self)})"
-
-    def contains_state(self, state):
-        return any(node.state == state for node in self.frontier)
-
-    def empty(self):
-        return len(self.frontier) == 0
-
-    def add(self, node):
-        self.frontier.append(node)
-
-    @abstractmethod
-    def remove(self):
-        """
-        Remove and return a node from the frontier. Subclasses must implement this function and the implementation
-        will determine whether the search is breadth first or depth first.
-        """
-        pass
-
-
-class StackFrontier(Frontier):
-    """
-    Implements depth first search.
-    """
-
-    def remove(self):
-        if self.empty():
-            raise Exception(EMPTY_FRONTIER)
-        else:
-            node = self.frontier.pop()
-            return node
-
-
-class QueueFrontier(Frontier):
-    """
-    Implements breadth first search.
-    """
-
-    def remove(self):
-        if self.empty():
-            raise Exception(EMPTY_FRONTIER)
-        else:
-            node = self.frontier[0]
-            self.frontier = self.frontier[1:]
-            return node
-
 
 class Maze:
     """Represents the search space."""
@@ -209,23 +116,43 @@ class Maze:
         if state != self.start and state != self.goal:  # Skip 'A' and 'B'
             print(f"\033[{row + 5};{col + 1}H*", end="", flush=True)
 
-    def solve(self):
-        """Finds a solution to maze, if one exists."""
+    def solve(self, animate=True):
+        """
+        Finds a solution to maze, if one exists.
+
+        With animate, the search is drawn in the terminal as it explores, slowed down to be watched. Without it the
+        maze is solved silently and at full speed.
+        """
 
         logging.info("Solving maze")
 
         # Keep track of number of states explored
         self.num_of_states_explored = 0
 
-        # Initialize frontier to just the starting position
-        start = Node(state=self.start, parent=None, action=None)
-        # logging.info(f"Adding {start.state} with {start.action}")
-        frontier = StackFrontier()  # StackFrontier QueueFrontier
-        frontier.add(start)
-
         # Initialize an empty explored set
         self.explored = set()
 
+        def explore(node):
+            self.explored.add(node.state)
+            self.num_of_states_explored += 1
+
+        def explore_and_draw(node):
+            explore(node)
+            self.update_explored_node(node.state)  # Update only the current node
+            time.sleep(0.1)  # Pause for
+
+        if not animate:
+            node = depth_first(
+                self.start,
+                lambda state: state == self.goal,
+                self.neighbors,
+                on_expand=explore,
+            )
+            if node is None:
+                raise Exception(NO_SOLUTION)
+            self._create_solution(node)
+            return
+
         self.print_initial_maze()
         print("\nExploring maze...\n")
 
@@ -233,45 +160,20 @@ class Maze:
             print("\033[?25l", end="", flush=True)
             time.sleep(1)  # Pause for
 
-            # Keep looping until solution found
-            while True:
-                # If nothing left in frontier, then no path
-                if frontier.empty():
-                    raise Exception(NO_SOLUTION)
-
-                # Extract the next node in the frontier to be examined
-                node = frontier.remove()
-                # logging.info(f"Checking {node.state}")
-
-                self.explored.add(node.state)
-                self.update_explored_node(node.state)  # Update only the current node
-                time.sleep(0.1)  # Pause for
-
-                self.num_of_states_explored += 1
-
-                if node.state == self.goal:
-                    self._create_solution(node)
-                    break
-
-                for action, state in self.neighbors(node.state):
-                    if (
-                        not frontier.contains_state(state)
-                        and state not in self.explored
-                    ):
-                        frontier.add(Node(state=state, parent=node, action=action))
+            # Search depth first, animating each node as it is explored
+            node = depth_first(
+                self.start,
+                lambda state: state == self.goal,
+                self.neighbors,
+                on_expand=explore_and_draw,
+            )
+            if node is None:
+                raise Exception(NO_SOLUTION)
+            self._create_solution(node)
         finally:
             print("\033[?25h", end="", flush=True)
             print(f"\033[{self.height + 29};1H", end="", flush=True)
 
-            # Mark node as explored
-            # self.explored.add(node.state)
-            # # logging.info(f"Adding {node.state} to explored")
-            # self._add_neighbours_to_frontier(frontier, node)
-            # for idx, node in enumerate(frontier.frontier):
-            #     print(f"Node {idx + 1}:")
-            #     pprint(vars(node), width=1)  # Use vars() to access all attributes
-            #     print()  # Add spacing between nodes
-
     def _create_solution(self, node):
         actions = []
         cells = []
@@ -308,6 +210,9 @@ class Maze:
         print()
 
     def output_image(self, filename, show_solution=True, show_explored=False):
+        # PIL is slow to import and only needed here
+        from PIL import Image, ImageDraw
+
         cell_size = 50
         cell_border = 2
 
@@ -362,6 +267,10 @@ class Maze:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
     # If no arg passed use default file.
     if len(sys.argv) != 2:
         maze_file = "maze1.txt"
@@ -0,0 +1,321 @@
+"""
+Search engines shared by the maze and degrees projects.
+
+Every engine works over a pluggable neighbors(state) callable that returns (action, state) pairs, so a problem only
+has to describe its state space. Frontiers are deques or heaps that track the states they hold in a set, so
+membership tests are constant time, and every engine accepts an on_expand(node) hook called as each node is
+expanded, for counting, logging or animating a search.
+"""
+
+import heapq
+import itertools
+import logging
+from abc import (
+    ABC,
+    abstractmethod,
+)  # ABC is a package that provides abstract base classes.
+from collections import deque
+
+EMPTY_FRONTIER = "empty frontier"
+
+
+class Node:
+    """
+    In search algorithms nodes represent the individual states that are explored during the search process.  A node
+    is a fundamental unit in search algorithms and encapsulated information about a particular state in the search space.
+
+    Attributes:
+          state: a tuple representing the position of the node in search space.  In this case it is a position within
+          a maze.
+          parent: The parent, or preceding, node in the search tree.  A Node can have only one parent but can be the
+          parent of many node.
+          action:  a List of possible actions, or moves, that can be taken from this state.
+
+    Nodes are slotted, since a search can create millions of them.
+    """
+
+    __slots__ = ("state", "parent", "action")
+
+    def __init__(self, state, parent, action):
+        self.state = state
+        self.parent = parent
+        self.action = action
+
+    def __repr__(self):
+        return f"Node(state={self.state}, parent={repr(self.parent)}, action={self.action})"
+
+
+class Frontier(ABC):
+    """
+    Abstract base class for frontiers.
+    Inherits from ABC to mark it as an abstract class and allow the use of the @abstractmethod decorator. If the class
+    did not inherit from ABC then the @abstractmethod decorator would not be honoured.
+
+    This class is used to represent the frontier of the search algorithm, i.e. the next nodes to be explored. The
+    states of the nodes it holds are kept in a set, so contains_state does not scan the frontier. A state should only
+    be added while it is not already in the frontier.
+    """
+
+    def __init__(self):
+        self.frontier = deque()
+        self.states = set()
+
+    def log_attributes(self):
+        # Formatting a large frontier is slow, so only do it when the debug output is wanted
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            from pprint import pformat
+
+            logging.debug(
+                "%s attributes: %s", self.__class__.__name__, pformat(vars(self))
+            )
+
+    def __repr__(self):
+        # Define a meaningful representation for the object
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            from pprint import pformat
+
+            logging.debug("Node attributes: %s", pformat(vars(self)))
+        return f"Node({vars(self)})"
+
+    def contains_state(self, state):
+        return state in self.states
+
+    def empty(self):
+        return len(self.frontier) == 0
+
+    def add(self, node):
+        self.frontier.append(node)
+        self.states.add(node.state)
+
+    def remove(self):
+        """
+        Remove and return a node from the frontier. Subclasses implement take, which determines whether the search is
+        breadth first or depth first.
+        """
+        if self.empty():
+            raise Exception(EMPTY_FRONTIER)
+        node = self.take()
+        self.states.discard(node.state)
+        return node
+
+    @abstractmethod
+    def take(self):
+        pass
+
+
+class StackFrontier(Frontier):
+    """
+    Implements depth first search.
+    """
+
+    def take(self):
+        return self.frontier.pop()
+
+
+class QueueFrontier(Frontier):
+    """
+    Implements breadth first search.
+    """
+
+    def take(self):
+        return self.frontier.popleft()
+
+
+def graph_search(
+    start, is_goal, neighbors, frontier, on_expand=None, goal_on_generate=False
+):
+    """
+    Yields the node of every goal state reachable from start, in the order the frontier finds them.
+
+    With goal_on_generate, states are goal tested as they are generated rather than when they are expanded, which
+    saves expanding a whole layer in breadth first search. The search resumes each time the caller asks for the next
+    goal, so callers wanting one goal simply stop asking.
+    """
+    node = Node(state=start, parent=None, action=None)
+    if goal_on_generate and is_goal(start):
+        yield node
+    frontier.add(node)
+    explored = set()
+
+    while not frontier.empty():
+        node = frontier.remove()
+        explored.add(node.state)
+        if on_expand is not None:
+            on_expand(node)
+        if not goal_on_generate and is_goal(node.state):
+            yield node
+
+        for action, state in neighbors(node.state):
+            if state in explored or frontier.contains_state(state):
+                continue
+            child = Node(state=state, parent=node, action=action)
+            if goal_on_generate and is_goal(state):
+                yield child
+            frontier.add(child)
+
+
+def breadth_first(start, is_goal, neighbors, on_expand=None):
+    """
+    Returns the node of the goal state closest to start, or None if no goal is reachable.
+    """
+    return next(breadth_first_goals(start, is_goal, neighbors, on_expand), None)
+
+
+def breadth_first_goals(start, is_goal, neighbors, on_expand=None):
+    """
+    Yields the node of every reachable goal state, nearest first, each by a shortest path.
+    """
+    return graph_search(
+        start, is_goal, neighbors, QueueFrontier(), on_expand, goal_on_generate=True
+    )
+
+
+def depth_first(start, is_goal, neighbors, on_expand=None):
+    """
+    Returns the node of the first goal state depth first search reaches, or None if no goal is reachable.
+    """
+    return next(
+        graph_search(start, is_goal, neighbors, StackFrontier(), on_expand), None
+    )
+
+
+def best_first(start, is_goal, neighbors, heuristic=None, cost=None, on_expand=None):
+    """
+    Returns the node of the cheapest goal state found by expanding states in order of path cost plus heuristic, or
+    None if no goal is reachable.
+
+    heuristic(state) estimates the remaining cost, zero by default; with an admissible and consistent heuristic this
+    is A*. cost(state, action, next_state) is the cost of a step, one by default.
+    """
+    counter = itertools.count()
+    root = Node(state=start, parent=None, action=None)
+    costs = {start: 0}
+    frontier = [(heuristic(start) if heuristic else 0, next(counter), root)]
+    explored = set()
+
+    while frontier:
+        _, _, node = heapq.heappop(frontier)
+        if node.state in explored:
+            continue
+        if on_expand is not None:
+            on_expand(node)
+        if is_goal(node.state):
+            return node
+        explored.add(node.state)
+
+        node_cost = costs[node.state]
+        for action, state in neighbors(node.state):
+            if state in explored:
+                continue
+            step = cost(node.state, action, state) if cost else 1
+            next_cost = node_cost + step
+            if next_cost >= costs.get(state, float("inf")):
+                continue
+            costs[state] = next_cost
+            estimate = next_cost + (heuristic(state) if heuristic else 0)
+            heapq.heappush(
+                frontier, (estimate, next(counter), Node(state, node, action))
+            )
+
+    return None
+
+
+def bidirectional(start, goal, neighbors, reverse_neighbors=None, on_expand=None):
+    """
+    Returns the shortest list of (action, state) steps from start to goal, or None if goal is unreachable, searching
+    breadth first from both ends and always growing the smaller side by a whole layer.
+
+    reverse_neighbors(state) returns (action, previous_state) pairs for the steps that lead into state. It defaults
+    to neighbors, which suits undirected problems whose action labels read the same both ways.
+    """
+    if start == goal:
+        return []
+    if reverse_neighbors is None:
+        reverse_neighbors = neighbors
+
+    # parents maps each state reached from start to (action, parent); children maps each state reached from goal
+    # to (action, child), the step that leads from it towards goal
+    parents = {start: None}
+    children = {goal: None}
+    forward = [start]
+    backward = [goal]
+
+    while forward and backward:
+        if len(forward) <= len(backward):
+            forward, meeting = _expand_layer(
+                forward, parents, children, neighbors, on_expand
+            )
+            if meeting is not None:
+                return _join(meeting, parents, children)
+        else:
+            backward, meeting = _expand_layer(
+                backward, children, parents, reverse_neighbors, on_expand
+            )
+            if meeting is not None:
+                state, action, other = meeting
+                return _join((other, action, state), parents, children)
+
+    return None
+
+
+def _expand_layer(layer, reached, opposite, neighbors, on_expand):
+    """
+    Expands a whole layer of one side. Returns (next_layer, meeting), where meeting is (state, action, next_state)
+    for an edge into the other side, taking the one closing the shortest path.
+    """
+    next_layer = []
+    meeting = None
+    meeting_length = None
+    for state in layer:
+        if on_expand is not None:
+            on_expand(Node(state=state, parent=None, action=None))
+        for action, next_state in neighbors(state):
+            if next_state in opposite:
+                length = _depth(next_state, opposite)
+                if meeting_length is None or length < meeting_length:
+                    meeting = (state, action, next_state)
+                    meeting_length = length
+            if next_state in reached:
+                continue
+            reached[next_state] = (action, state)
+            next_layer.append(next_state)
+    return next_layer, meeting
+
+
+def _depth(state, reached):
+    depth = 0
+    while reached[state] is not None:
+        state = reached[state][1]
+        depth += 1
+    return depth
+
+
+def _join(meeting, parents, children):
+    """
+    Returns the (action, state) steps of the path through the edge meeting = (state, action, next_state).
+    """
+    state, action, next_state = meeting
+    steps = []
+    while parents[state] is not None:
+        parent_action, parent = parents[state]
+        steps.append((parent_action, state))
+        state = parent
+    steps.reverse()
+    steps.append((action, next_state))
+    while children[next_state] is not None:
+        child_action, child = children[next_state]
+        steps.append((child_action, child))
+        next_state = child
+    return steps
+
+
+def path_to(node):
+    """
+    Follows parent links back from node and returns the (action, state) steps in order from the start.
+    """
+    steps = []
+    while node.parent is not None:
+        steps.append((node.action, node.state))
+        node = node.parent
+    steps.reverse()
+    return steps
@@ -0,0 +1,206 @@
+"""
+Headless self-play benchmark for the tictactoe engine.
+
+Plays seeded games engine against engine and engine against a random player through the tictactoe module functions,
+timing every engine move and recording the nodes it searched and its transposition table hits. The report is printed
+as JSON, so runs of different engine versions can be compared: engine_losses catches correctness regressions, and
+nodes_per_second and seconds_per_move catch speed regressions.
+
+On 3x3 every engine move is a lookup in the solved position table, which says nothing about the search. With
+--no-solved-table the table is bypassed and the transposition table emptied before each engine move, so every move is
+a full alpha-beta search and nodes_per_second measures the search itself.
+
+Usage: python -m src.cs50_intro_to_ai_with_python.tictactoe.benchmark [--games N] [--seed S] [--rows M]
+    [--columns N] [--k K] [--time-limit S] [--processes P] [--random-openings R] [--no-solved-table]
+    [--output FILE]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+
+from src.cs50_intro_to_ai_with_python.arguments import positive_int
+from src.cs50_intro_to_ai_with_python.tictactoe import tictactoe as ttt
+
+ENGINE = "engine"
+RANDOM = "random"
+
+
+def play(players, rng, random_openings=0, clear_table=False):
+    """
+    Plays one game, players mapping X and O to ENGINE or RANDOM. The first random_openings moves are played at
+    random whoever is to move, so engine against engine games differ. clear_table empties the 3x3 transposition
+    table before each engine move.
+
+    Returns a dict of the winner (None for a tie), the moves and the stats of every engine move.
+    """
+    board = ttt.initial_state()
+    moves = []
+    engine_moves = []
+    while not ttt.terminal(board):
+        player = ttt.player(board)
+        if players[player] == RANDOM or len(moves) < random_openings:
+            action = rng.choice(sorted(ttt.actions(board)))
+        else:
+            if clear_table:
+                ttt.transposition_table.clear()
+            started = time.perf_counter()
+            action = ttt.minimax(board)
+            seconds = time.perf_counter() - started
+            engine_moves.append(dict(ttt.search_stats(), seconds=seconds))
+        board = ttt.result(board, action)
+        moves.append(list(action))
+    return {
+        "players": players,
+        "winner": ttt.winner(board),
+        "moves": moves,
+        "engine_moves": engine_moves,
+    }
+
+
+def run(games, seed=0, random_openings=0, clear_table=False):
+    """
+    Plays games engine against engine and games engine against random (the engine taking X and O in turn), and
+    returns the report. clear_table empties the 3x3 transposition table before each engine move.
+    """
+    rng = random.Random(seed)
+    matches = {
+        "engine_vs_engine": [
+            play({ttt.X: ENGINE, ttt.O: ENGINE}, rng, random_openings, clear_table)
+            for _ in range(games)
+        ],
+        "engine_vs_random": [
+            play(
+                {ttt.X: ENGINE, ttt.O: RANDOM}
+                if game % 2 == 0
+                else {ttt.X: RANDOM, ttt.O: ENGINE},
+                rng,
+                clear_table=clear_table,
+            )
+            for game in range(games)
+        ],
+    }
+    return {
+        "seed": seed,
+        "games": games,
+        "random_openings": random_openings,
+        "clear_table": clear_table,
+        "matches": {name: summarise(results) for name, results in matches.items()},
+    }
+
+
+def summarise(results):
+    """
+    Returns the summary of a list of games from play.
+    """
+    outcomes = {ttt.X: 0, ttt.O: 0, "tie": 0}
+    engine_losses = 0
+    for game in results:
+        outcomes[game["winner"] or "tie"] += 1
+        winner = game["winner"]
+        if winner is not None and game["players"][winner] == RANDOM:
+            engine_losses += 1
+
+    engine_moves = [move for game in results for move in game["engine_moves"]]
+    seconds = [move["seconds"] for move in engine_moves]
+    nodes = sum(move["nodes"] for move in engine_moves)
+    table_hits = sum(move["table_hits"] for move in engine_moves)
+    total_seconds = sum(seconds)
+    return {
+        "results": outcomes,
+        "engine_losses": engine_losses,
+        "engine_moves": len(engine_moves),
+        "nodes": nodes,
+        "nodes_per_second": round(nodes / total_seconds) if total_seconds else None,
+        "table_hit_rate": round(table_hits / nodes, 4) if nodes else None,
+        "mean_depth": round(statistics.fmean(move["depth"] for move in engine_moves), 2)
+        if engine_moves
+        else None,
+        "seconds_per_move": {
+            "mean": round(statistics.fmean(seconds), 6) if seconds else None,
+            "max": round(max(seconds), 6) if seconds else None,
+        },
+        # Move lists let a surprising game be replayed
+        "games": [
+            {"winner": game["winner"], "moves": game["moves"]} for game in results
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the tictactoe engine by self-play."
+    )
+    parser.add_argument(
+        "--games", type=positive_int, default=20, help="games per match"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--rows", type=int, default=3, help="number of rows (m)")
+    parser.add_argument("--columns", type=int, default=3, help="number of columns (n)")
+    parser.add_argument(
+        "--k", type=int, default=3, help="number in a row needed to win"
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=1.0,
+        help="seconds per engine move on boards larger than 3x3",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="worker processes on boards larger than 3x3 (0 for every core)",
+    )
+    parser.add_argument(
+        "--random-openings",
+        type=int,
+        default=2,
+        help="random moves opening each engine against engine game",
+    )
+    parser.add_argument(
+        "--no-solved-table",
+        dest="solved_table",
+        action="store_false",
+        help="search 3x3 moves from scratch instead of looking them up",
+    )
+    parser.add_argument("--output", help="file to write the JSON report to")
+    args = parser.parse_args()
+
+    try:
+        ttt.configure(
+            args.rows,
+            args.columns,
+            args.k,
+            time_limit=args.time_limit,
+            processes=args.processes or None,
+            solved_table=args.solved_table,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        report = run(
+            args.games,
+            seed=args.seed,
+            random_openings=args.random_openings,
+            clear_table=not args.solved_table,
+        )
+    finally:
+        ttt.configure()
+    report["board"] = {"rows": args.rows, "columns": args.columns, "k": args.k}
+    report["solved_table"] = args.solved_table
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,532 @@
+"""
+m,n,k-games: tic-tac-toe generalised to m rows, n columns and k in a row to win.
+
+Boards are lists of m rows of n cells, as in tictactoe.py, converted to bitboards of m * n bits with cell (i, j) at
+bit i * n + j. Exhaustive search is hopeless beyond 3x3, so Search deepens an alpha-beta search one ply at a time until
+its time budget runs out, and plays the best move of the deepest search it finished. Positions are cached in a
+Zobrist-hashed transposition table, moves are ordered by the table's best move, killer moves and the history
+heuristic, and unfinished positions are scored by the open lines and threats each player has.
+"""
+
+import math
+import random
+import time
+
+X = "X"
+O = "O"  # noqa: E741
+EMPTY = None
+
+# Scores of won positions, less the number of plies to the win, so quicker wins score higher
+WIN_SCORE = 1_000_000
+
+# Scores of positions the side to move has won or lost by force, though the winning line is not yet complete
+THREAT_SCORE = WIN_SCORE // 2
+
+# Only empty cells within this many cells of a stone are searched, since moves far from every stone are rarely good
+NEIGHBORHOOD_RADIUS = 2
+
+# How a transposition table value relates to the true value of its position
+EXACT, LOWER_BOUND, UPPER_BOUND = range(3)
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside a search when its time budget runs out.
+    """
+
+
+class Game:
+    """
+    The rules of one m,n,k-game.
+
+    Attributes:
+          lines: masks of every run of k cells in a row, column or diagonal.
+          lines_through: for each cell, the masks of the lines through it, so a move is checked for a win against
+          those lines only.
+          neighborhoods: for each cell, the mask of the cells within NEIGHBORHOOD_RADIUS of it.
+          max_score: the largest magnitude evaluate gives a position not won or lost by force, which is below every
+          forced value.
+          zobrist: random 64-bit keys for each player (X then O) and cell; a position's hash is the xor of the keys of
+          its stones.
+    """
+
+    def __init__(self, m=3, n=3, k=3, seed=0):
+        if m < 1 or n < 1:
+            raise ValueError("board must have at least one row and one column")
+        if not 1 <= k <= max(m, n):
+            raise ValueError("k must be between 1 and the longer side of the board")
+        self.m = m
+        self.n = n
+        self.k = k
+        self.cells = m * n
+        self.full_board = (1 << self.cells) - 1
+        self.max_score = THREAT_SCORE - self.cells - 1
+
+        self.lines = []
+        for i in range(m):
+            for j in range(n):
+                for di, dj in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    end_i, end_j = i + di * (k - 1), j + dj * (k - 1)
+                    if 0 <= end_i < m and 0 <= end_j < n:
+                        self.lines.append(
+                            sum(
+                                1 << self.index(i + di * s, j + dj * s)
+                                for s in range(k)
+                            )
+                        )
+        self.lines_through = [
+            [line for line in self.lines if line >> cell & 1]
+            for cell in range(self.cells)
+        ]
+
+        self.neighborhoods = []
+        for cell in range(self.cells):
+            i, j = divmod(cell, n)
+            mask = 0
+            for r in range(
+                max(0, i - NEIGHBORHOOD_RADIUS), min(m, i + NEIGHBORHOOD_RADIUS + 1)
+            ):
+                for c in range(
+                    max(0, j - NEIGHBORHOOD_RADIUS), min(n, j + NEIGHBORHOOD_RADIUS + 1)
+                ):
+                    mask |= 1 << self.index(r, c)
+            self.neighborhoods.append(mask)
+
+        # Cells nearer the centre take part in more lines, so they are tried first among otherwise equal moves
+        centre_i, centre_j = (m - 1) / 2, (n - 1) / 2
+        self.centrality = [
+            -abs(cell // n - centre_i) - abs(cell % n - centre_j)
+            for cell in range(self.cells)
+        ]
+        self.centre = max(range(self.cells), key=self.centrality.__getitem__)
+
+        rng = random.Random(seed)
+        self.zobrist = [
+            [rng.getrandbits(64) for _ in range(self.cells)] for _ in (X, O)
+        ]
+
+    def index(self, i, j):
+        return i * self.n + j
+
+    def initial_state(self):
+        """
+        Returns starting state of the board.
+        """
+        return [[EMPTY] * self.n for _ in range(self.m)]
+
+    def to_bits(self, board):
+        """
+        Returns the (x_bits, o_bits) bitboards of a board given as lists of rows.
+        """
+        x_bits = o_bits = 0
+        for i, row in enumerate(board):
+            for j, cell in enumerate(row):
+                if cell == X:
+                    x_bits |= 1 << self.index(i, j)
+                elif cell == O:
+                    o_bits |= 1 << self.index(i, j)
+        return x_bits, o_bits
+
+    def player(self, board):
+        """
+        Returns player who has the next turn on a board.
+        """
+        return self.player_bits(*self.to_bits(board))
+
+    def actions(self, board):
+        """
+        Returns set of all possible actions (i, j) available on the board.
+        """
+        return {
+            (i, j) for i in range(self.m) for j in range(self.n) if board[i][j] == EMPTY
+        }
+
+    def result(self, board, action):
+        """
+        Returns the board that results from making move (i, j) on the board.
+        """
+        i, j = action
+        if not (0 <= i < self.m and 0 <= j < self.n) or board[i][j] != EMPTY:
+            raise ValueError(f"invalid action: {action}")
+        new_board = [list(row) for row in board]
+        new_board[i][j] = self.player(board)
+        return new_board
+
+    def winner(self, board):
+        """
+        Returns the winner of the game, if there is one.
+        """
+        x_bits, o_bits = self.to_bits(board)
+        if self.has_line(x_bits):
+            return X
+        if self.has_line(o_bits):
+            return O
+        return None
+
+    def terminal(self, board):
+        """
+        Returns True if game is over, False otherwise.
+        """
+        return self.terminal_bits(*self.to_bits(board))
+
+    def utility(self, board):
+        """
+        Returns 1 if X has won the game, -1 if O has won, 0 otherwise.
+        """
+        return {X: 1, O: -1}.get(self.winner(board), 0)
+
+    def player_bits(self, x_bits, o_bits):
+        """
+        Returns the player who has the next turn on a bitboard.
+        """
+        return O if x_bits.bit_count() > o_bits.bit_count() else X
+
+    def has_line(self, bits):
+        for line in self.lines:
+            if bits & line == line:
+                return True
+        return False
+
+    def completes_line(self, bits, cell):
+        """
+        Returns True if bits, which include cell, hold a whole line through cell.
+        """
+        for line in self.lines_through[cell]:
+            if bits & line == line:
+                return True
+        return False
+
+    def terminal_bits(self, x_bits, o_bits):
+        """
+        Returns True if the game on a bitboard is over.
+        """
+        return (
+            self.has_line(x_bits)
+            or self.has_line(o_bits)
+            or (x_bits | o_bits) == self.full_board
+        )
+
+    def hash_bits(self, x_bits, o_bits):
+        """
+        Returns the Zobrist hash of a bitboard.
+        """
+        key = 0
+        for side, bits in enumerate((x_bits, o_bits)):
+            for cell in iter_cells(bits):
+                key ^= self.zobrist[side][cell]
+        return key
+
+    def near_stones(self, occupied):
+        """
+        Returns the mask of cells within NEIGHBORHOOD_RADIUS of any stone in occupied.
+        """
+        near = 0
+        for cell in iter_cells(occupied):
+            near |= self.neighborhoods[cell]
+        return near
+
+    def evaluate(self, me, them):
+        """
+        Scores a position for the player to move, whose stones are me.
+
+        Every line still open to just one player counts for that player, more steeply the more of it they hold. A
+        line one stone short wins next move for the player to move, and two such lines on different cells cannot
+        both be blocked, so those positions score as won or lost. On a large board with a large k the line weights
+        can add up past the forced values, so other positions are clamped to max_score.
+        """
+        k = self.k
+        score = 0
+        their_threats = 0
+        for line in self.lines:
+            mine = me & line
+            theirs = them & line
+            if mine and not theirs:
+                count = mine.bit_count()
+                if count == k - 1:
+                    return THREAT_SCORE
+                score += 1 << (3 * count)
+            elif theirs and not mine:
+                count = theirs.bit_count()
+                if count == k - 1:
+                    their_threats |= line & ~them
+                score -= 1 << (3 * count)
+        if their_threats.bit_count() > 1:
+            return -THREAT_SCORE
+        return max(-self.max_score, min(self.max_score, score))
+
+
+class Search:
+    """
+    Iterative-deepening alpha-beta search over a Game with a time budget per move.
+
+    Attributes:
+          table: maps Zobrist hashes to (depth, value, bound, best move cell).
+          killers: for each ply, the last two moves that caused a cutoff there.
+          history: for each cell, how much its cutoffs have been worth so far.
+          nodes, table_hits, depth: statistics of the last search, the depth being the deepest one finished.
+          stop_event: optional threading or multiprocessing event that stops the search, like running out of time,
+          once set.
+          cancelled: whether cancel was called during the current search, or before the next one starts.
+    """
+
+    # The table is cleared rather than allowed to grow past this many entries
+    max_table_size = 1 << 20
+
+    def __init__(self, game, time_limit=1.0, max_depth=None, stop_event=None):
+        self.game = game
+        self.stop_event = stop_event
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.table = {}
+        self.killers = []
+        self.history = [0] * game.cells
+        self.nodes = 0
+        self.table_hits = 0
+        self.depth = 0
+        self.deadline = math.inf
+        self.cancelled = False
+
+    def minimax(self, board):
+        """
+        Returns the best action (i, j) found for the current player on the board, or None if the game is over.
+        """
+        x_bits, o_bits = self.game.to_bits(board)
+        cell = self.best_move(x_bits, o_bits)
+        return None if cell is None else divmod(cell, self.game.n)
+
+    def best_move(self, x_bits, o_bits, time_limit=None):
+        """
+        Returns the cell of the best move found for the player to move on a bitboard within time_limit seconds
+        (the search's own by default), or None if the game is over.
+
+        Each iteration searches the root moves with the previous iteration's best first, then by centrality, and
+        keeps the first move of highest value, so the move found at each depth depends only on the position.
+        """
+        game = self.game
+        if game.terminal_bits(x_bits, o_bits):
+            self.cancelled = False
+            return None
+        position = self.position(x_bits, o_bits)
+        self.start(self.time_limit if time_limit is None else time_limit)
+
+        best = self.root_moves(position, None)[0]
+        for depth in range(1, self.depth_limit(x_bits, o_bits) + 1):
+            alpha = -math.inf
+            best_value = -math.inf
+            try:
+                for cell in self.root_moves(position, best):
+                    value = self.move_value(position, cell, depth, alpha, math.inf)
+                    # Later moves only replace the best if strictly better, so ties keep the earlier move
+                    if value > best_value:
+                        best_value, depth_best = value, cell
+                    alpha = max(alpha, value)
+            except SearchTimeout:
+                break
+            best = depth_best
+            self.depth = depth
+            if self.forced(best_value):
+                break
+        self.deadline = math.inf
+        self.cancelled = False
+        return best
+
+    def cancel(self):
+        """
+        Stops a search running in another thread, which then returns the best move of the deepest search it finished.
+
+        The search may not have started yet, so rather than ending its time budget, which start() resets, this sets a
+        flag that only the search returning clears.
+        """
+        self.cancelled = True
+
+    def position(self, x_bits, o_bits):
+        """
+        Returns the (me, them, near, key, side) search state of a bitboard, me being the stones of the player to move
+        and side 0 for X or 1 for O.
+        """
+        game = self.game
+        side = 0 if game.player_bits(x_bits, o_bits) == X else 1
+        me, them = (x_bits, o_bits) if side == 0 else (o_bits, x_bits)
+        near = game.near_stones(x_bits | o_bits)
+        return me, them, near, game.hash_bits(x_bits, o_bits), side
+
+    def start(self, time_limit):
+        """
+        Resets the statistics and move ordering state for a new search ending time_limit seconds from now.
+        """
+        if len(self.table) > self.max_table_size:
+            self.table.clear()
+        self.nodes = 0
+        self.table_hits = 0
+        self.depth = 0
+        self.killers = []
+        self.history = [0] * self.game.cells
+        self.deadline = time.perf_counter() + time_limit
+
+    def depth_limit(self, x_bits, o_bits):
+        empty_cells = self.game.cells - (x_bits | o_bits).bit_count()
+        if self.max_depth is None:
+            return empty_cells
+        return min(self.max_depth, empty_cells)
+
+    def forced(self, value):
+        """
+        Returns True if a value is a forced win or loss, which deeper searches cannot change.
+        """
+        return abs(value) >= THREAT_SCORE - self.game.cells
+
+    def root_moves(self, position, previous_best):
+        """
+        Returns the cells to search at the root: previous_best first, then by centrality.
+        """
+        me, them, near, _, _ = position
+        occupied = me | them
+        candidates = near & ~occupied if occupied else 1 << self.game.centre
+        centrality = self.game.centrality
+        return sorted(
+            iter_cells(candidates),
+            key=lambda cell: (cell == previous_best, centrality[cell]),
+            reverse=True,
+        )
+
+    def move_value(self, position, cell, depth, alpha, beta, ply=0):
+        """
+        Returns the value for the player to move of playing cell in a position, searched depth plies deep.
+        """
+        game = self.game
+        me, them, near, key, side = position
+        new_me = me | 1 << cell
+        if game.completes_line(new_me, cell):
+            return WIN_SCORE - ply - 1
+        if new_me | them == game.full_board:
+            return 0
+        return -self._negamax(
+            them,
+            new_me,
+            near | game.neighborhoods[cell],
+            key ^ game.zobrist[side][cell],
+            1 - side,
+            depth - 1,
+            -beta,
+            -alpha,
+            ply + 1,
+        )
+
+    def _negamax(self, me, them, near, key, side, depth, alpha, beta, ply):
+        """
+        Returns the value of a position for the player to move, whose stones are me, searched depth plies deep.
+
+        Table entries are only reused at the depth they were searched to, so a value depends only on the position
+        and depth, never on which searches ran before.
+        """
+        self.nodes += 1
+        if self.nodes & 1023 == 0 and self._out_of_time():
+            raise SearchTimeout
+        if depth == 0:
+            value = self.game.evaluate(me, them)
+            # Threats are wins a move or two away, so score them by ply like wins
+            if value == THREAT_SCORE:
+                return THREAT_SCORE - ply
+            if value == -THREAT_SCORE:
+                return ply - THREAT_SCORE
+            return value
+
+        table_move = None
+        entry = self.table.get(key)
+        if entry is not None:
+            entry_depth, value, bound, table_move = entry
+            if entry_depth == depth:
+                self.table_hits += 1
+                value = _from_table(value, ply)
+                if bound == EXACT:
+                    return value
+                if bound == LOWER_BOUND:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        original_alpha = alpha
+        best_value = -math.inf
+        best_move = None
+        position = (me, them, near, key, side)
+        for cell in self._ordered_moves(me, them, near, ply, table_move):
+            value = self.move_value(position, cell, depth, alpha, beta, ply)
+            if value > best_value:
+                best_value, best_move = value, cell
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                self._record_cutoff(cell, depth, ply)
+                break
+
+        if best_value <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_value >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self.table[key] = (depth, _to_table(best_value, ply), bound, best_move)
+        return best_value
+
+    def _out_of_time(self):
+        if self.cancelled or time.perf_counter() > self.deadline:
+            return True
+        return self.stop_event is not None and self.stop_event.is_set()
+
+    def _ordered_moves(self, me, them, near, ply, table_move):
+        """
+        Returns the cells to search: the table's best move first, then killer moves, then by history and centrality.
+        """
+        occupied = me | them
+        candidates = near & ~occupied if occupied else 1 << self.game.centre
+        killers = self.killers[ply] if ply < len(self.killers) else ()
+        history = self.history
+        centrality = self.game.centrality
+        return sorted(
+            iter_cells(candidates),
+            key=lambda cell: (
+                cell == table_move,
+                cell in killers,
+                history[cell],
+                centrality[cell],
+            ),
+            reverse=True,
+        )
+
+    def _record_cutoff(self, cell, depth, ply):
+        while len(self.killers) <= ply:
+            self.killers.append([])
+        killers = self.killers[ply]
+        if cell not in killers:
+            killers.insert(0, cell)
+            del killers[2:]
+        self.history[cell] += depth * depth
+
+
+def iter_cells(bits):
+    """
+    Yields the index of every set bit, lowest first.
+    """
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def _to_table(value, ply):
+    # Win scores count plies from the root, so are stored counting from the position instead
+    if value >= THREAT_SCORE:
+        return value + ply
+    if value <= -THREAT_SCORE:
+        return value - ply
+    return value
+
+
+def _from_table(value, ply):
+    if value >= THREAT_SCORE:
+        return value - ply
+    if value <= -THREAT_SCORE:
+        return value + ply
+    return value
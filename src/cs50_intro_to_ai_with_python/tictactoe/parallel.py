@@ -0,0 +1,264 @@
+"""
+Parallel root-split search for the m,n,k engine.
+
+Each iteration of the deepening search hands the root moves out to a process pool, where every worker keeps its own
+Search and transposition table between tasks. The first root move, the previous iteration's best, is searched alone
+with a full window, and the rest are then searched in parallel with its value as alpha ("young brothers wait"), so
+most of them only have to show they are no better. Moves searched that way return their value only if it is above
+alpha, so the first move of highest value in the sequential root order is played, as the sequential Search plays it
+at every depth both finish.
+
+Usage: python -m src.cs50_intro_to_ai_with_python.tictactoe.parallel [--rows M] [--columns N] [--k K] [--depth D]
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import time
+
+from src.cs50_intro_to_ai_with_python.tictactoe import mnk
+
+# The search each worker process runs its tasks with, and the number of the parent's newest search, see _start_worker
+_worker_search = None
+_worker_generation = None
+
+
+class ParallelSearch:
+    """
+    Iterative-deepening search that splits the root moves of each iteration across worker processes.
+
+    Attributes:
+          worker_nodes: maps the process id of each worker to the nodes it searched during the last move.
+          nodes, table_hits, depth, seconds: statistics of the last search, the depth being the deepest one finished.
+          cancelled: whether cancel was called during the current search, or before the next one starts.
+          generation: shared with the workers, the number of the newest search. It moves on when a search starts or
+          is cancelled, so tasks of older searches still queued or running in the pool stop at once.
+    """
+
+    def __init__(self, game, processes=None, time_limit=1.0, max_depth=None):
+        self.game = game
+        self.processes = processes or os.cpu_count() or 1
+        self.time_limit = time_limit
+        # Only used for root move ordering and depth limits; the searching happens in the workers
+        self.search = mnk.Search(game, time_limit=time_limit, max_depth=max_depth)
+        self.pool = None
+        self.worker_nodes = {}
+        self.nodes = 0
+        self.table_hits = 0
+        self.depth = 0
+        self.seconds = 0.0
+        self.cancelled = False
+        self.generation = multiprocessing.Value("Q", 0)
+
+    def minimax(self, board):
+        """
+        Returns the best action (i, j) found for the current player on the board, or None if the game is over.
+        """
+        x_bits, o_bits = self.game.to_bits(board)
+        cell = self.best_move(x_bits, o_bits)
+        return None if cell is None else divmod(cell, self.game.n)
+
+    def best_move(self, x_bits, o_bits, time_limit=None):
+        """
+        Returns the cell of the best move found for the player to move on a bitboard within time_limit seconds
+        (the search's own by default), or None if the game is over.
+        """
+        if self.game.terminal_bits(x_bits, o_bits):
+            self.cancelled = False
+            return None
+        self.start_workers()
+
+        started = time.perf_counter()
+        time_limit = self.time_limit if time_limit is None else time_limit
+        # Workers compare against the wall clock, which unlike perf_counter is shared between processes
+        deadline = time.time() + time_limit
+        search = self.search
+        position = search.position(x_bits, o_bits)
+        self.worker_nodes = {}
+        self.table_hits = 0
+        self.depth = 0
+        generation = self._next_generation()
+
+        best = search.root_moves(position, None)[0]
+        for depth in range(1, search.depth_limit(x_bits, o_bits) + 1):
+            first, *rest = search.root_moves(position, best)
+            values = self._search_moves(
+                x_bits, o_bits, [first], depth, deadline, -math.inf, generation
+            )
+            if values is None:
+                break
+            best_value = values[first]
+            values = self._search_moves(
+                x_bits, o_bits, rest, depth, deadline, best_value, generation
+            )
+            if values is None:
+                break
+            # Moves no better than the first fail low, so only a strictly better one replaces it, the earliest
+            # in root order among equals
+            depth_best = first
+            for cell in rest:
+                if values[cell] > best_value:
+                    best_value, depth_best = values[cell], cell
+            best = depth_best
+            self.depth = depth
+            if search.forced(best_value):
+                break
+
+        self.nodes = sum(self.worker_nodes.values())
+        self.seconds = time.perf_counter() - started
+        self.cancelled = False
+        return best
+
+    def _search_moves(self, x_bits, o_bits, cells, depth, deadline, alpha, generation):
+        """
+        Searches root moves depth plies deep on the workers, with the window (alpha, infinity). Returns a dict of
+        their values, or None if time ran out or the search was cancelled first.
+        """
+        if self.cancelled:
+            return None
+        tasks = [
+            (x_bits, o_bits, cell, depth, deadline, alpha, generation) for cell in cells
+        ]
+        values = {}
+        for cell, value, pid, nodes, table_hits in self.pool.imap_unordered(
+            _search_move, tasks
+        ):
+            self.worker_nodes[pid] = self.worker_nodes.get(pid, 0) + nodes
+            self.table_hits += table_hits
+            if value is None or self.cancelled:
+                return None
+            values[cell] = value
+        return values
+
+    def cancel(self):
+        """
+        Stops a search running in another thread, which then returns the best move of the deepest search it
+        finished. Called before the search starts, it stops that search as soon as it does.
+        """
+        self.cancelled = True
+        self._next_generation()
+
+    def _next_generation(self):
+        with self.generation.get_lock():
+            self.generation.value += 1
+            return self.generation.value
+
+    def start_workers(self):
+        """
+        Starts the worker processes, if they are not already running.
+        """
+        if self.pool is None:
+            game = self.game
+            self.pool = multiprocessing.Pool(
+                self.processes,
+                initializer=_start_worker,
+                initargs=(game.m, game.n, game.k, self.generation),
+            )
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+
+
+def compare(game, board, depth, processes=None):
+    """
+    Searches a board to a fixed depth sequentially and in parallel, and returns a dict of the moves, node counts,
+    times and speedup.
+    """
+    x_bits, o_bits = game.to_bits(board)
+
+    sequential = mnk.Search(game, time_limit=math.inf, max_depth=depth)
+    started = time.perf_counter()
+    sequential_move = sequential.best_move(x_bits, o_bits)
+    sequential_seconds = time.perf_counter() - started
+
+    parallel = ParallelSearch(game, processes, time_limit=math.inf, max_depth=depth)
+    try:
+        # Start the workers before timing, as a game would have them running already
+        parallel.start_workers()
+        parallel_move = parallel.best_move(x_bits, o_bits)
+    finally:
+        parallel.close()
+
+    return {
+        "depth": depth,
+        "processes": parallel.processes,
+        "sequential_move": sequential_move,
+        "parallel_move": parallel_move,
+        "same_move": sequential_move == parallel_move,
+        "sequential_nodes": sequential.nodes,
+        "parallel_nodes": parallel.nodes,
+        "worker_nodes": sorted(parallel.worker_nodes.values(), reverse=True),
+        "sequential_seconds": round(sequential_seconds, 4),
+        "parallel_seconds": round(parallel.seconds, 4),
+        "speedup": round(sequential_seconds / parallel.seconds, 2)
+        if parallel.seconds
+        else None,
+    }
+
+
+def _start_worker(m, n, k, generation):
+    global _worker_search, _worker_generation
+    _worker_generation = generation
+    _worker_search = mnk.Search(mnk.Game(m, n, k))
+
+
+class _Superseded:
+    """
+    The stop event of a worker's search, set once the parent has started a newer search or cancelled this one.
+    """
+
+    def __init__(self, generation):
+        self.generation = generation
+
+    def is_set(self):
+        return _worker_generation.value != self.generation
+
+
+def _search_move(task):
+    """
+    Searches one root move in a worker with the window (alpha, infinity). Returns (cell, value, pid, nodes,
+    table_hits), the value being None if time ran out or the task belongs to an older search.
+    """
+    x_bits, o_bits, cell, depth, deadline, alpha, generation = task
+    if _worker_generation.value != generation:
+        return cell, None, os.getpid(), 0, 0
+    search = _worker_search
+    search.stop_event = _Superseded(generation)
+    search.start(deadline - time.time())
+    try:
+        value = search.move_value(
+            search.position(x_bits, o_bits), cell, depth, alpha, math.inf
+        )
+    except mnk.SearchTimeout:
+        value = None
+    search.deadline = math.inf
+    return cell, value, os.getpid(), search.nodes, search.table_hits
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare sequential and parallel search on an m,n,k-game."
+    )
+    parser.add_argument("--rows", type=int, default=7, help="number of rows (m)")
+    parser.add_argument("--columns", type=int, default=7, help="number of columns (n)")
+    parser.add_argument(
+        "--k", type=int, default=5, help="number in a row needed to win"
+    )
+    parser.add_argument("--depth", type=int, default=4, help="search depth")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes")
+    args = parser.parse_args()
+
+    game = mnk.Game(args.rows, args.columns, args.k)
+    # Search the reply to an opening move in the centre, which has a move on every cell around it
+    board = game.initial_state()
+    board = game.result(board, divmod(game.centre, game.n))
+    print(json.dumps(compare(game, board, args.depth, args.processes), indent=2))
+
+
+if __name__ == "__main__":
+    main()
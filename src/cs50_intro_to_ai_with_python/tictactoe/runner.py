@@ -1,8 +1,44 @@
+"""
+Usage: python -m src.cs50_intro_to_ai_with_python.tictactoe.runner [--rows M] [--columns N] [--k K] [--time-limit S]
+    [--processes P]
+"""
+
+import argparse
+import concurrent.futures
+import os
 import pygame
 import sys
-import time
 
-import tictactoe as ttt
+from src.cs50_intro_to_ai_with_python.tictactoe import tictactoe as ttt
+
+parser = argparse.ArgumentParser(description="Play an m,n,k-game against the computer.")
+parser.add_argument("--rows", type=int, default=3, help="number of rows (m)")
+parser.add_argument("--columns", type=int, default=3, help="number of columns (n)")
+parser.add_argument("--k", type=int, default=3, help="number in a row needed to win")
+parser.add_argument(
+    "--time-limit",
+    type=float,
+    default=1.0,
+    help="seconds the computer may think per move on boards larger than 3x3",
+)
+parser.add_argument(
+    "--processes",
+    type=int,
+    default=1,
+    help="worker processes to search with on boards larger than 3x3 (0 for every core)",
+)
+args = parser.parse_args()
+try:
+    ttt.configure(
+        args.rows,
+        args.columns,
+        args.k,
+        time_limit=args.time_limit,
+        processes=args.processes or None,
+    )
+except ValueError as e:
+    parser.error(str(e))
+rows, columns = args.rows, args.columns
 
 pygame.init()
 size = width, height = 600, 400
@@ -13,78 +49,115 @@ white = (255, 255, 255)
 
 screen = pygame.display.set_mode(size)
 
-mediumFont = pygame.font.Font("OpenSans-Regular.ttf", 28)
-largeFont = pygame.font.Font("OpenSans-Regular.ttf", 40)
-moveFont = pygame.font.Font("OpenSans-Regular.ttf", 60)
+# Fit the board between the title and the Play Again button
+tile_size = min(80, (height - 150) // rows, (width - 40) // columns)
+
+font_path = os.path.join(os.path.dirname(__file__), "OpenSans-Regular.ttf")
+mediumFont = pygame.font.Font(font_path, 28)
+largeFont = pygame.font.Font(font_path, 40)
+moveFont = pygame.font.Font(font_path, tile_size * 3 // 4)
+
+# Render the text that never changes once, rather than every frame
+title = largeFont.render("Play Tic-Tac-Toe", True, white)
+titleRect = title.get_rect()
+titleRect.center = ((width / 2), 50)
+
+playXButton = pygame.Rect((width / 8), (height / 2), width / 4, 50)
+playX = mediumFont.render("Play as X", True, black)
+playXRect = playX.get_rect()
+playXRect.center = playXButton.center
+
+playOButton = pygame.Rect(5 * (width / 8), (height / 2), width / 4, 50)
+playO = mediumFont.render("Play as O", True, black)
+playORect = playO.get_rect()
+playORect.center = playOButton.center
+
+againButton = pygame.Rect(width / 3, height - 65, width / 3, 50)
+again = mediumFont.render("Play Again", True, black)
+againRect = again.get_rect()
+againRect.center = againButton.center
+
+moves = {player: moveFont.render(player, True, white) for player in (ttt.X, ttt.O)}
+
+# Game titles are rendered the first time each is shown
+titles = {}
+
+
+def render_title(text):
+    if text not in titles:
+        titles[text] = largeFont.render(text, True, white)
+    return titles[text]
+
+
+# The board's tiles never move either
+tile_origin = (
+    width / 2 - (columns / 2 * tile_size),
+    height / 2 - (rows / 2 * tile_size),
+)
+tiles = [
+    [
+        pygame.Rect(
+            tile_origin[0] + j * tile_size,
+            tile_origin[1] + i * tile_size,
+            tile_size,
+            tile_size,
+        )
+        for j in range(columns)
+    ]
+    for i in range(rows)
+]
+
+# The computer thinks on a background thread, so the window keeps drawing and handling events meanwhile
+FPS = 60
+clock = pygame.time.Clock()
+executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
 user = None
 board = ttt.initial_state()
-ai_turn = False
+# The move the computer is thinking about, if any
+ai_move = None
 
 while True:
+    click = None
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
+            ttt.cancel()
             sys.exit()
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            click = event.pos
 
     screen.fill(black)
 
     # Let user choose a player.
     if user is None:
         # Draw title
-        title = largeFont.render("Play Tic-Tac-Toe", True, white)
-        titleRect = title.get_rect()
-        titleRect.center = ((width / 2), 50)
         screen.blit(title, titleRect)
 
         # Draw buttons
-        playXButton = pygame.Rect((width / 8), (height / 2), width / 4, 50)
-        playX = mediumFont.render("Play as X", True, black)
-        playXRect = playX.get_rect()
-        playXRect.center = playXButton.center
         pygame.draw.rect(screen, white, playXButton)
         screen.blit(playX, playXRect)
-
-        playOButton = pygame.Rect(5 * (width / 8), (height / 2), width / 4, 50)
-        playO = mediumFont.render("Play as O", True, black)
-        playORect = playO.get_rect()
-        playORect.center = playOButton.center
         pygame.draw.rect(screen, white, playOButton)
         screen.blit(playO, playORect)
 
         # Check if button is clicked
-        click, _, _ = pygame.mouse.get_pressed()
-        if click == 1:
-            mouse = pygame.mouse.get_pos()
-            if playXButton.collidepoint(mouse):
-                time.sleep(0.2)
+        if click is not None:
+            if playXButton.collidepoint(click):
                 user = ttt.X
-            elif playOButton.collidepoint(mouse):
-                time.sleep(0.2)
+            elif playOButton.collidepoint(click):
                 user = ttt.O
 
     else:
         # Draw game board
-        tile_size = 80
-        tile_origin = (width / 2 - (1.5 * tile_size), height / 2 - (1.5 * tile_size))
-        tiles = []
-        for i in range(3):
-            row = []
-            for j in range(3):
-                rect = pygame.Rect(
-                    tile_origin[0] + j * tile_size,
-                    tile_origin[1] + i * tile_size,
-                    tile_size,
-                    tile_size,
-                )
-                pygame.draw.rect(screen, white, rect, 3)
+        for i in range(rows):
+            for j in range(columns):
+                rect = tiles[i][j]
+                pygame.draw.rect(screen, white, rect, 3 if tile_size >= 40 else 1)
 
                 if board[i][j] != ttt.EMPTY:
-                    move = moveFont.render(board[i][j], True, white)
+                    move = moves[board[i][j]]
                     moveRect = move.get_rect()
                     moveRect.center = rect.center
                     screen.blit(move, moveRect)
-                row.append(rect)
-            tiles.append(row)
 
         game_over = ttt.terminal(board)
         player = ttt.player(board)
@@ -93,51 +166,43 @@ while True:
         if game_over:
             winner = ttt.winner(board)
             if winner is None:
-                title = "Game Over: Tie."
+                text = "Game Over: Tie."
             else:
-                title = f"Game Over: {winner} wins."
+                text = f"Game Over: {winner} wins."
         elif user == player:
-            title = f"Play as {user}"
+            text = f"Play as {user}"
         else:
-            title = "Computer thinking..."
-        title = largeFont.render(title, True, white)
-        titleRect = title.get_rect()
-        titleRect.center = ((width / 2), 30)
-        screen.blit(title, titleRect)
+            text = "Computer thinking..."
+        gameTitle = render_title(text)
+        gameTitleRect = gameTitle.get_rect()
+        gameTitleRect.center = ((width / 2), 30)
+        screen.blit(gameTitle, gameTitleRect)
 
         # Check for AI move
         if user != player and not game_over:
-            if ai_turn:
-                time.sleep(0.5)
-                move = ttt.minimax(board)
-                board = ttt.result(board, move)
-                ai_turn = False
-            else:
-                ai_turn = True
+            if ai_move is None:
+                ai_move = executor.submit(ttt.minimax, board)
+            elif ai_move.done():
+                board = ttt.result(board, ai_move.result())
+                ai_move = None
 
         # Check for a user move
-        click, _, _ = pygame.mouse.get_pressed()
-        if click == 1 and user == player and not game_over:
-            mouse = pygame.mouse.get_pos()
-            for i in range(3):
-                for j in range(3):
-                    if board[i][j] == ttt.EMPTY and tiles[i][j].collidepoint(mouse):
+        if click is not None and user == player and not game_over:
+            for i in range(rows):
+                for j in range(columns):
+                    if board[i][j] == ttt.EMPTY and tiles[i][j].collidepoint(click):
                         board = ttt.result(board, (i, j))
 
-        if game_over:
-            againButton = pygame.Rect(width / 3, height - 65, width / 3, 50)
-            again = mediumFont.render("Play Again", True, black)
-            againRect = again.get_rect()
-            againRect.center = againButton.center
-            pygame.draw.rect(screen, white, againButton)
-            screen.blit(again, againRect)
-            click, _, _ = pygame.mouse.get_pressed()
-            if click == 1:
-                mouse = pygame.mouse.get_pos()
-                if againButton.collidepoint(mouse):
-                    time.sleep(0.2)
-                    user = None
-                    board = ttt.initial_state()
-                    ai_turn = False
+        # Play Again is offered throughout the game, and abandons any move the computer is thinking about
+        pygame.draw.rect(screen, white, againButton)
+        screen.blit(again, againRect)
+        if click is not None and againButton.collidepoint(click):
+            # A move not yet started is dropped, and a finished one must not be cancelled, or the next search would be
+            if ai_move is not None and not ai_move.cancel() and not ai_move.done():
+                ttt.cancel()
+            ai_move = None
+            user = None
+            board = ttt.initial_state()
 
     pygame.display.flip()
+    clock.tick(FPS)
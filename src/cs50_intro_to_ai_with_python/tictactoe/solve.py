@@ -0,0 +1,60 @@
+"""
+Generates the solved position table tictactoe.minimax answers from.
+
+Every position reachable in play is reduced to its canonical form under the 8 rotations and reflections of the
+board, solved by alpha-beta search, and stored with its value and a best move for the player to move.
+
+Usage: python -m src.cs50_intro_to_ai_with_python.tictactoe.solve [filename]
+"""
+
+import json
+import sys
+
+from src.cs50_intro_to_ai_with_python.tictactoe import tictactoe as ttt
+
+
+def solve():
+    """
+    Returns a dict mapping every canonical position key to (value, best move cell index), the move being None for
+    finished games.
+    """
+    solved = {}
+    stack = [(0, 0)]
+    while stack:
+        x_bits, o_bits = stack.pop()
+        key, _ = ttt.canonical(x_bits, o_bits)
+        if key in solved:
+            continue
+        # Solve the canonical board itself, so its move needs no mapping
+        canonical_x, canonical_o = key & ttt.FULL_BOARD, key >> 9
+        value = ttt.value(canonical_x, canonical_o)
+        if ttt.terminal_bits(canonical_x, canonical_o):
+            solved[key] = (value, None)
+            continue
+        i, j = ttt.search(canonical_x, canonical_o)
+        solved[key] = (value, 3 * i + j)
+
+        x_to_move = ttt.player_bits(x_bits, o_bits) == ttt.X
+        occupied = x_bits | o_bits
+        for bit in ttt.MOVE_BITS:
+            if not occupied & bit:
+                stack.append(
+                    (x_bits | bit, o_bits) if x_to_move else (x_bits, o_bits | bit)
+                )
+    return solved
+
+
+def main():
+    if len(sys.argv) > 2:
+        sys.exit("Usage: python solve.py [filename]")
+    filename = sys.argv[1] if len(sys.argv) == 2 else ttt.SOLVED_FILENAME
+
+    solved = solve()
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump({str(key): list(entry) for key, entry in sorted(solved.items())}, f)
+        f.write("\n")
+    print(f"Solved {len(solved)} positions.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,134 @@
 """
 Tic Tac Toe Player
+
+Boards are passed in and out as lists of rows, but the engine works on bitboards: one 9-bit int per player, with bit
+3 * i + j set when that player holds cell (i, j). Boards are converted at the boundary, so the search itself allocates
+no lists and detects wins by masking against the 8 lines.
+
+minimax answers from a precomputed table of every position, solved up to rotation and reflection, which is generated
+by solve.py and loaded the first time it is needed. Without the table it falls back to searching.
+
+configure switches every function to a larger m,n,k-game, played by the engine in mnk.py.
 """
 
+import json
+import math
+import os
+
+from src.cs50_intro_to_ai_with_python.tictactoe import mnk, parallel
+
 X = "X"
 O = "O"  # noqa: E741
 EMPTY = None
 
+# The bit of each cell, and the cell of each bit
+CELL_BITS = {(i, j): 1 << (3 * i + j) for i in range(3) for j in range(3)}
+BIT_CELLS = {bit: cell for cell, bit in CELL_BITS.items()}
+
+FULL_BOARD = (1 << 9) - 1
+
+# The masks of the 3 rows, 3 columns and 2 diagonals
+LINES = (
+    0b000000111,
+    0b000111000,
+    0b111000000,
+    0b001001001,
+    0b010010010,
+    0b100100100,
+    0b100010001,
+    0b001010100,
+)
+
+# Moves are searched centre first, then corners, then edges, since the strongest moves are usually found first in
+# that order and alpha-beta then prunes the rest
+MOVE_ORDER = [(1, 1), (0, 0), (0, 2), (2, 0), (2, 2), (0, 1), (1, 0), (1, 2), (2, 1)]
+MOVE_BITS = tuple(CELL_BITS[cell] for cell in MOVE_ORDER)
+
+
+def _symmetries():
+    symmetries = []
+    for reflect in (False, True):
+        for turns in range(4):
+            symmetry = []
+            for index in range(9):
+                i, j = divmod(index, 3)
+                if reflect:
+                    j = 2 - j
+                for _ in range(turns):
+                    i, j = j, 2 - i
+                symmetry.append(3 * i + j)
+            symmetries.append(tuple(symmetry))
+    return symmetries
+
+
+# The 8 rotations and reflections of the board, each as a tuple mapping a cell index to its index after the symmetry
+SYMMETRIES = _symmetries()
+
+SOLVED_FILENAME = os.path.join(os.path.dirname(__file__), "solved.json")
+
+# Maps canonical positions (as x_bits | o_bits << 9) to (value, best move cell index or None), see solved_positions
+_solved = None
+
+# How a transposition table value relates to the true minimax value of its board
+EXACT, LOWER_BOUND, UPPER_BOUND = range(3)
+
+# Maps boards (as x_bits | o_bits << 9) to (value, bound) pairs. The player to move is determined by the board, so the
+# board alone is the key. Positions searched for one move are reused by every later move of every game.
+transposition_table = {}
+
+# The m,n,k-game and its search when configured for anything but 3x3 tic-tac-toe, see configure
+_game = None
+_search = None
+
+# Whether 3x3 minimax answers from the solved position table, see configure
+_use_solved_table = True
+
+# Statistics of the last 3x3 minimax call, see search_stats
+_stats = {"nodes": 0, "table_hits": 0, "depth": 0}
+
+
+def configure(m=3, n=3, k=3, time_limit=1.0, processes=1, solved_table=True):
+    """
+    Sets the game played by the functions below to m rows, n columns and k in a row to win. Any game but 3x3
+    tic-tac-toe is played by the m,n,k engine, whose minimax searches for up to time_limit seconds per move, splitting
+    the root moves across processes worker processes (every core if None) when more than one. 3x3 tic-tac-toe is
+    answered from the solved position table, or searched like a table that has not been generated if solved_table is
+    False.
+    """
+    global _game, _search, _use_solved_table
+    _use_solved_table = solved_table
+    if isinstance(_search, parallel.ParallelSearch):
+        _search.close()
+    if (m, n, k) == (3, 3, 3):
+        _game = _search = None
+    elif processes == 1:
+        _game = mnk.Game(m, n, k)
+        _search = mnk.Search(_game, time_limit=time_limit)
+    else:
+        _game = mnk.Game(m, n, k)
+        _search = parallel.ParallelSearch(
+            _game, processes=processes, time_limit=time_limit
+        )
+        # Start the workers now, before any thread that calls minimax, since forking a threaded process is unsafe
+        _search.start_workers()
+
+
+def cancel():
+    """
+    Stops a minimax call running in another thread on a configured m,n,k-game, which then returns the best move found
+    so far. A call that has not started yet is stopped as soon as it starts. 3x3 tic-tac-toe is answered from the
+    solved table and needs no cancelling.
+    """
+    if _search is not None:
+        _search.cancel()
+
 
 def initial_state():
     """
     Returns starting state of the board.
     """
+    if _game is not None:
+        return _game.initial_state()
     return [[EMPTY, EMPTY, EMPTY], [EMPTY, EMPTY, EMPTY], [EMPTY, EMPTY, EMPTY]]
 
 
@@ -18,46 +136,270 @@ def player(board):
     """
     Returns player who has the next turn on a board.
     """
-    raise NotImplementedError
+    if _game is not None:
+        return _game.player(board)
+    x_bits, o_bits = to_bits(board)
+    return player_bits(x_bits, o_bits)
 
 
 def actions(board):
     """
     Returns set of all possible actions (i, j) available on the board.
     """
-    raise NotImplementedError
+    if _game is not None:
+        return _game.actions(board)
+    x_bits, o_bits = to_bits(board)
+    occupied = x_bits | o_bits
+    return {cell for cell, bit in CELL_BITS.items() if not occupied & bit}
 
 
 def result(board, action):
     """
     Returns the board that results from making move (i, j) on the board.
     """
-    raise NotImplementedError
+    if _game is not None:
+        return _game.result(board, action)
+    i, j = action
+    if not (0 <= i < 3 and 0 <= j < 3) or board[i][j] != EMPTY:
+        raise ValueError(f"invalid action: {action}")
+    new_board = [list(row) for row in board]
+    new_board[i][j] = player(board)
+    return new_board
 
 
 def winner(board):
     """
     Returns the winner of the game, if there is one.
     """
-    raise NotImplementedError
+    if _game is not None:
+        return _game.winner(board)
+    x_bits, o_bits = to_bits(board)
+    if _has_line(x_bits):
+        return X
+    if _has_line(o_bits):
+        return O
+    return None
 
 
 def terminal(board):
     """
     Returns True if game is over, False otherwise.
     """
-    raise NotImplementedError
+    if _game is not None:
+        return _game.terminal(board)
+    x_bits, o_bits = to_bits(board)
+    return terminal_bits(x_bits, o_bits)
 
 
 def utility(board):
     """
     Returns 1 if X has won the game, -1 if O has won, 0 otherwise.
     """
-    raise NotImplementedError
+    return {X: 1, O: -1}.get(winner(board), 0)
 
 
 def minimax(board):
     """
     Returns the optimal action for the current player on the board.
     """
-    raise NotImplementedError
+    if _search is not None:
+        return _search.minimax(board)
+    _stats.update(nodes=0, table_hits=0, depth=0)
+    x_bits, o_bits = to_bits(board)
+    if terminal_bits(x_bits, o_bits):
+        return None
+
+    _stats["depth"] = 9 - (x_bits | o_bits).bit_count()
+    solved = solved_positions() if _use_solved_table else {}
+    if solved:
+        # A lookup counts as one node, found in the table
+        _stats.update(nodes=1, table_hits=1)
+        key, symmetry = canonical(x_bits, o_bits)
+        _, move = solved[key]
+        # Map the move back from the canonical board to this one
+        return divmod(symmetry.index(move), 3)
+    return search(x_bits, o_bits)
+
+
+def search_stats():
+    """
+    Returns a dict of the nodes searched, transposition table hits and depth searched by the last minimax call.
+    """
+    if _search is not None:
+        return {
+            "nodes": _search.nodes,
+            "table_hits": _search.table_hits,
+            "depth": _search.depth,
+        }
+    return dict(_stats)
+
+
+def search(x_bits, o_bits):
+    """
+    Returns the optimal action for the player to move on a non-terminal bitboard, found by alpha-beta search.
+    """
+    maximizing = player_bits(x_bits, o_bits) == X
+    best_action = None
+    best_value = -math.inf if maximizing else math.inf
+    alpha, beta = -math.inf, math.inf
+    occupied = x_bits | o_bits
+    for bit in MOVE_BITS:
+        if occupied & bit:
+            continue
+        value = _move_value(x_bits, o_bits, bit, maximizing, alpha, beta)
+        if maximizing and value > best_value:
+            best_action, best_value = BIT_CELLS[bit], value
+            alpha = max(alpha, value)
+        elif not maximizing and value < best_value:
+            best_action, best_value = BIT_CELLS[bit], value
+            beta = min(beta, value)
+    return best_action
+
+
+def value(x_bits, o_bits):
+    """
+    Returns the exact minimax value of a bitboard: 1 if X wins with perfect play, -1 if O does, 0 for a tie.
+    """
+    if _has_line(x_bits):
+        return 1
+    if _has_line(o_bits):
+        return -1
+    if x_bits | o_bits == FULL_BOARD:
+        return 0
+    x_to_move = player_bits(x_bits, o_bits) == X
+    return _value(x_bits, o_bits, x_to_move, -math.inf, math.inf)
+
+
+def canonical(x_bits, o_bits):
+    """
+    Returns (key, symmetry) for the smallest key x_bits | o_bits << 9 among the 8 symmetric images of a bitboard, and
+    the symmetry that maps the bitboard onto it.
+    """
+    best = None
+    for symmetry in SYMMETRIES:
+        key = _transform(x_bits, symmetry) | _transform(o_bits, symmetry) << 9
+        if best is None or key < best[0]:
+            best = (key, symmetry)
+    return best
+
+
+def solved_positions():
+    """
+    Returns the solved position table, loading it on first use, or an empty dict if it has not been generated.
+    """
+    global _solved
+    if _solved is None:
+        try:
+            with open(SOLVED_FILENAME, encoding="utf-8") as f:
+                _solved = {
+                    int(key): (entry[0], entry[1])
+                    for key, entry in json.load(f).items()
+                }
+        except FileNotFoundError:
+            _solved = {}
+    return _solved
+
+
+def to_bits(board):
+    """
+    Returns the (x_bits, o_bits) bitboards of a board given as lists of rows.
+    """
+    x_bits = o_bits = 0
+    for (i, j), bit in CELL_BITS.items():
+        cell = board[i][j]
+        if cell == X:
+            x_bits |= bit
+        elif cell == O:
+            o_bits |= bit
+    return x_bits, o_bits
+
+
+def _transform(bits, symmetry):
+    transformed = 0
+    for index in range(9):
+        if bits >> index & 1:
+            transformed |= 1 << symmetry[index]
+    return transformed
+
+
+def player_bits(x_bits, o_bits):
+    """
+    Returns the player who has the next turn on a bitboard.
+    """
+    return O if x_bits.bit_count() > o_bits.bit_count() else X
+
+
+def _has_line(bits):
+    for line in LINES:
+        if bits & line == line:
+            return True
+    return False
+
+
+def terminal_bits(x_bits, o_bits):
+    """
+    Returns True if the game on a bitboard is over.
+    """
+    return _has_line(x_bits) or _has_line(o_bits) or (x_bits | o_bits) == FULL_BOARD
+
+
+def _move_value(x_bits, o_bits, bit, x_to_move, alpha, beta):
+    """
+    Returns the minimax value after the player to move takes the cell of bit. Only the mover can have just won.
+    """
+    if x_to_move:
+        x_bits |= bit
+        if _has_line(x_bits):
+            return 1
+    else:
+        o_bits |= bit
+        if _has_line(o_bits):
+            return -1
+    if x_bits | o_bits == FULL_BOARD:
+        return 0
+    return _value(x_bits, o_bits, not x_to_move, alpha, beta)
+
+
+def _value(x_bits, o_bits, x_to_move, alpha, beta):
+    """
+    Returns the minimax value of a non-terminal board, searched with alpha-beta pruning. The result is only exact when
+    it lies strictly between alpha and beta; otherwise it is a bound on the true value, which is all the caller needs.
+    """
+    _stats["nodes"] += 1
+    key = x_bits | o_bits << 9
+    entry = transposition_table.get(key)
+    if entry is not None:
+        _stats["table_hits"] += 1
+        value, bound = entry
+        if bound == EXACT:
+            return value
+        if bound == LOWER_BOUND:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        if alpha >= beta:
+            return value
+
+    original_alpha, original_beta = alpha, beta
+    best_value = -math.inf if x_to_move else math.inf
+    occupied = x_bits | o_bits
+    for bit in MOVE_BITS:
+        if occupied & bit:
+            continue
+        value = _move_value(x_bits, o_bits, bit, x_to_move, alpha, beta)
+        if x_to_move:
+            best_value = max(best_value, value)
+            alpha = max(alpha, value)
+        else:
+            best_value = min(best_value, value)
+            beta = min(beta, value)
+        if alpha >= beta:
+            break
+
+    if best_value <= original_alpha:
+        transposition_table[key] = (best_value, UPPER_BOUND)
+    elif best_value >= original_beta:
+        transposition_table[key] = (best_value, LOWER_BOUND)
+    else:
+        transposition_table[key] = (best_value, EXACT)
+    return best_value
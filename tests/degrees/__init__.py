@@ -0,0 +1 @@
+SMALL = "src/cs50_intro_to_ai_with_python/degrees/small"
@@ -0,0 +1,70 @@
+import io
+import json
+
+import pytest
+
+from src.cs50_intro_to_ai_with_python.degrees import batch, degrees
+from tests.degrees import SMALL
+
+QUERIES = [
+    ("Kevin Bacon", "Dustin Hoffman"),
+    ("Kevin Bacon", "Cary Elwes"),
+    ("102", "Emma Watson"),
+    ("Tom Hanks", "Kevin Bacon"),
+    ("Nobody", "Kevin Bacon"),
+]
+
+
+class TestBatch:
+    @pytest.fixture(autouse=True)
+    def small(self):
+        degrees.load_data(SMALL)
+
+    def test_read_queries(self):
+        lines = ["Kevin Bacon\tTom Hanks\n", "\n", "102\t158\n"]
+        assert batch.read_queries(lines) == [
+            ("Kevin Bacon", "Tom Hanks"),
+            ("102", "158"),
+        ]
+
+    def test_read_queries_rejects_malformed_line(self):
+        with pytest.raises(ValueError, match="line 1"):
+            batch.read_queries(["Kevin Bacon\n"])
+
+    def test_group_by_source(self):
+        groups, errors = batch.group_by_source(QUERIES)
+        assert sorted(groups) == ["102", "158"]
+        assert len(groups["102"]) == 3
+        assert errors == [
+            {
+                "index": 4,
+                "source": "Nobody",
+                "target": "Kevin Bacon",
+                "error": "person not found",
+                "candidates": [],
+            }
+        ]
+
+    @pytest.mark.parametrize("processes", [1, 2])
+    def test_run_batch(self, processes):
+        out = io.StringIO()
+        batch.run_batch(QUERIES, out, processes=processes)
+        records = {
+            record["index"]: record
+            for record in map(json.loads, out.getvalue().splitlines())
+        }
+        assert sorted(records) == [0, 1, 2, 3, 4]
+        assert records[0]["degrees"] == 2
+        assert records[0]["path"][-1] == {"movie_id": "95953", "person_id": "163"}
+        assert records[1]["degrees"] == 3
+        assert records[2]["path"] is None
+        assert records[3]["degrees"] == 1
+        assert "error" in records[4]
+
+    def test_unresolved_names_list_candidates(self):
+        _, errors = batch.group_by_source([("Kevin Bacon", "Tom Hank")])
+        assert errors[0]["candidates"][0]["person_id"] == "158"
+
+    def test_run_batch_rejects_non_positive_processes(self):
+        with pytest.raises(ValueError, match="processes"):
+            batch.run_batch(QUERIES, io.StringIO(), processes=0)
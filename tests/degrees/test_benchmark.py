@@ -0,0 +1,40 @@
+from src.cs50_intro_to_ai_with_python.degrees import benchmark, generate
+from src.cs50_intro_to_ai_with_python.degrees.graph import Graph
+
+
+class TestBenchmark:
+    def test_run(self, tmp_path):
+        generate.generate(tmp_path, people=1000, movies=400, seed=2)
+        report = benchmark.run(str(tmp_path), queries=30, parallel=False)
+        assert report["load"]["people"] == 1000
+        assert report["load"]["seconds"] > 0
+        assert "landmarks" not in report
+        queries = report["shortest_path"]
+        assert queries["queries"] == 30
+        assert 0 < queries["connected"] <= 30
+        seconds = queries["seconds"]
+        assert seconds["p50"] <= seconds["p90"] <= seconds["p99"] <= seconds["max"]
+
+    def test_run_compares_landmark_astar(self, tmp_path):
+        generate.generate(tmp_path, people=1000, movies=400, seed=2)
+        report = benchmark.run(
+            str(tmp_path), queries=20, parallel=False, landmark_count=4
+        )
+        astar = report["landmarks"]["astar"]
+        # The same pairs are searched, and both searches find shortest paths
+        assert astar["connected"] == report["shortest_path"]["connected"]
+        assert astar["mean_degrees"] == report["shortest_path"]["mean_degrees"]
+
+    def test_same_seed_times_same_queries(self, tmp_path):
+        generate.generate(tmp_path, people=500, movies=200, seed=2)
+        graph = Graph.from_directory(tmp_path, parallel=False)
+        first = benchmark.measure_queries(graph, 20, seed=5)
+        second = benchmark.measure_queries(graph, 20, seed=5)
+        assert first["connected"] == second["connected"]
+        assert first["mean_degrees"] == second["mean_degrees"]
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        assert benchmark.percentile(values, 50) == 50
+        assert benchmark.percentile(values, 99) == 99
+        assert benchmark.percentile([3.0], 90) == 3.0
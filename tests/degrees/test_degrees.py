@@ -0,0 +1,123 @@
+import pytest
+
+from src.cs50_intro_to_ai_with_python.degrees import degrees
+from src.cs50_intro_to_ai_with_python.degrees.util import (
+    LRUCache,
+    Node,
+    QueueFrontier,
+    UnionFind,
+)
+from tests.degrees import SMALL
+
+KEVIN_BACON = "102"
+TOM_HANKS = "158"
+TOM_CRUISE = "129"
+DUSTIN_HOFFMAN = "163"
+CARY_ELWES = "144"
+EMMA_WATSON = "914612"
+
+
+class TestDegrees:
+    @pytest.fixture(autouse=True)
+    def small(self):
+        degrees.load_data(SMALL)
+
+    def test_load_data(self):
+        assert degrees.names["kevin bacon"] == {KEVIN_BACON}
+        assert degrees.people[TOM_HANKS]["movies"] == {"109830", "112384"}
+        assert TOM_CRUISE in degrees.movies["104257"]["stars"]
+
+    def test_neighbors_for_person(self):
+        neighbors = degrees.neighbors_for_person(KEVIN_BACON)
+        assert ("112384", TOM_HANKS) in neighbors
+        assert ("104257", TOM_CRUISE) in neighbors
+        assert neighbors is degrees.neighbors_for_person(KEVIN_BACON)
+
+    def test_iter_neighbors_skips_expanded_movies(self):
+        expanded_movies = {"104257"}
+        neighbors = set(degrees.iter_neighbors_for_person(KEVIN_BACON, expanded_movies))
+        assert all(movie_id == "112384" for movie_id, _ in neighbors)
+        assert expanded_movies == {"104257", "112384"}
+
+    def test_hub_actors_are_expanded_from_cache(self, monkeypatch):
+        monkeypatch.setattr(degrees.graph, "hub_movie_count", 1)
+        path = degrees.shortest_path(KEVIN_BACON, DUSTIN_HOFFMAN)
+        assert path == [("104257", TOM_CRUISE), ("95953", DUSTIN_HOFFMAN)]
+        assert degrees.graph.neighbor_cache.get(KEVIN_BACON) is not None
+        assert degrees.graph.neighbor_cache.get(DUSTIN_HOFFMAN) is not None
+
+    def test_shortest_path(self):
+        path = degrees.shortest_path(KEVIN_BACON, DUSTIN_HOFFMAN)
+        assert path == [("104257", TOM_CRUISE), ("95953", DUSTIN_HOFFMAN)]
+
+    def test_shortest_path_two_hops_via_any_movie(self):
+        path = degrees.shortest_path(KEVIN_BACON, CARY_ELWES)
+        assert len(path) == 3
+        assert path[-1] == ("93779", CARY_ELWES)
+
+    def test_shortest_path_to_self(self):
+        assert degrees.shortest_path(KEVIN_BACON, KEVIN_BACON) == []
+
+    def test_shortest_path_not_connected(self):
+        assert degrees.shortest_path(KEVIN_BACON, EMMA_WATSON) is None
+
+    def test_disconnected_queries_do_not_search(self, monkeypatch):
+        def fail(*args):
+            raise AssertionError("searched a disconnected pair")
+
+        monkeypatch.setattr(degrees.graph, "iter_neighbors_for_person", fail)
+        assert degrees.shortest_paths(KEVIN_BACON, {EMMA_WATSON}) == {EMMA_WATSON: None}
+
+    def test_components(self):
+        assert degrees.connected(KEVIN_BACON, CARY_ELWES)
+        assert not degrees.connected(KEVIN_BACON, EMMA_WATSON)
+        assert degrees.component_id(KEVIN_BACON) == degrees.component_id(TOM_HANKS)
+        assert degrees.component_size(KEVIN_BACON) == 15
+        assert degrees.component_size(EMMA_WATSON) == 1
+
+
+class TestLRUCache:
+    def test_evicts_least_recently_used_past_maxsize(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_discard_and_clear(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.discard("a")
+        cache.discard("missing")
+        assert cache.get("a", "default") == "default"
+        cache.put("b", 2)
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestUnionFind:
+    def test_union_and_sizes(self):
+        sets = UnionFind()
+        for item in "abcd":
+            sets.add(item)
+        sets.union("a", "b")
+        sets.union("c", "b")
+        assert sets.find("a") == sets.find("c")
+        assert sets.find("d") != sets.find("a")
+        assert sets.set_size("c") == 3
+        assert sets.set_size("d") == 1
+
+
+class TestQueueFrontier:
+    def test_removes_in_insertion_order(self):
+        frontier = QueueFrontier()
+        for state in range(3):
+            frontier.add(Node(state=state, parent=None, action=None))
+        assert frontier.contains_state(1)
+        assert [frontier.remove().state for _ in range(3)] == [0, 1, 2]
+        assert not frontier.contains_state(1)
+        assert frontier.empty()
@@ -0,0 +1,66 @@
+import csv
+
+import pytest
+
+from src.cs50_intro_to_ai_with_python.degrees import generate
+from src.cs50_intro_to_ai_with_python.degrees.graph import Graph
+from tests.degrees import SMALL
+
+FILENAMES = ("people.csv", "movies.csv", "stars.csv")
+
+
+class TestGenerate:
+    @pytest.fixture
+    def dataset(self, tmp_path):
+        counts = generate.generate(tmp_path, people=2000, movies=800, seed=1)
+        return tmp_path, counts
+
+    def test_headers_match_shipped_data(self, dataset):
+        directory, _ = dataset
+        for filename in FILENAMES:
+            with open(directory / filename, encoding="utf-8") as f:
+                generated = f.readline()
+            with open(f"{SMALL}/{filename}", encoding="utf-8") as f:
+                assert generated == f.readline()
+
+    def test_names_and_titles_are_quoted(self, dataset):
+        directory, _ = dataset
+        with open(directory / "people.csv", encoding="utf-8") as f:
+            person_id, name, birth = f.readlines()[1].rstrip("\n").split(",")
+        assert person_id.isdigit()
+        assert name.startswith('"') and name.endswith('"')
+        assert birth == "" or birth.isdigit()
+
+    def test_loads_into_graph(self, dataset):
+        directory, counts = dataset
+        graph = Graph.from_directory(directory, parallel=False)
+        assert len(graph.people) == counts["people"] == 2000
+        assert len(graph.movies) == counts["movies"] == 800
+        assert (
+            sum(len(movie["stars"]) for movie in graph.movies.values())
+            == counts["credits"]
+        )
+        # Every movie has a cast of at least two, so it connects its stars
+        assert all(len(movie["stars"]) >= 2 for movie in graph.movies.values())
+
+    def test_careers_are_heavy_tailed(self, dataset):
+        directory, _ = dataset
+        with open(directory / "stars.csv", encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))[1:]
+        careers = {}
+        for person_id, _ in rows:
+            careers[person_id] = careers.get(person_id, 0) + 1
+        lengths = sorted(careers.values())
+        assert lengths[len(lengths) // 2] <= 2
+        assert lengths[-1] >= 20
+
+    def test_same_seed_writes_same_files(self, tmp_path):
+        generate.generate(tmp_path / "a", people=500, movies=200, seed=7)
+        generate.generate(tmp_path / "b", people=500, movies=200, seed=7)
+        generate.generate(tmp_path / "c", people=500, movies=200, seed=8)
+        for filename in FILENAMES:
+            a = (tmp_path / "a" / filename).read_bytes()
+            assert a == (tmp_path / "b" / filename).read_bytes()
+        assert (tmp_path / "a" / "stars.csv").read_bytes() != (
+            tmp_path / "c" / "stars.csv"
+        ).read_bytes()
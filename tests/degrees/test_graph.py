@@ -0,0 +1,78 @@
+import gc
+import socket
+
+import pytest
+
+from src.cs50_intro_to_ai_with_python.degrees import graph as graph_module
+from src.cs50_intro_to_ai_with_python.degrees.graph import Graph
+from tests.degrees import SMALL
+
+KEVIN_BACON = "102"
+TOM_HANKS = "158"
+DUSTIN_HOFFMAN = "163"
+
+
+@pytest.fixture
+def tiny(tmp_path):
+    (tmp_path / "people.csv").write_text(
+        'id,name,birth\n1,"Kevin Bacon",1958\n2,"Someone Else",1970\n'
+    )
+    (tmp_path / "movies.csv").write_text('id,title,year\n10,"Only Film",2000\n')
+    (tmp_path / "stars.csv").write_text("person_id,movie_id\n1,10\n2,10\n")
+    return tmp_path
+
+
+class TestGraph:
+    def test_graphs_hold_separate_datasets(self, tiny):
+        small = Graph.from_directory(SMALL, parallel=False)
+        other = Graph.from_directory(tiny, parallel=False)
+        assert small.person_ids_for_name("Kevin Bacon") == [KEVIN_BACON]
+        assert other.person_ids_for_name("Kevin Bacon") == ["1"]
+        assert len(small.shortest_path(KEVIN_BACON, DUSTIN_HOFFMAN)) == 2
+        assert other.shortest_path("1", "2") == [("10", "2")]
+        assert TOM_HANKS not in other.people
+
+    def test_methods(self):
+        graph = Graph.from_directory(SMALL, parallel=False)
+        assert ("112384", TOM_HANKS) in graph.neighbors_for_person(KEVIN_BACON)
+        assert graph.person_id_for_name("tom hanks") == TOM_HANKS
+        assert graph.shortest_paths(KEVIN_BACON, {TOM_HANKS, KEVIN_BACON}) == {
+            TOM_HANKS: [("112384", TOM_HANKS)],
+            KEVIN_BACON: [],
+        }
+
+    @pytest.mark.skipif(not graph_module.can_fork(), reason="needs fork")
+    def test_process_pool_shares_graph(self, tiny):
+        small = Graph.from_directory(SMALL, parallel=False)
+        other = Graph.from_directory(tiny, parallel=False)
+        with small.process_pool(1) as small_pool, other.process_pool(1) as other_pool:
+            assert small_pool.apply(
+                graph_module.worker_shortest_path, (KEVIN_BACON, TOM_HANKS)
+            ) == [("112384", TOM_HANKS)]
+            assert other_pool.apply(graph_module.worker_shortest_path, ("1", "2")) == [
+                ("10", "2")
+            ]
+
+    @pytest.mark.skipif(not graph_module.can_fork(), reason="needs fork")
+    def test_process_executor_workers_close_fds(self, tiny):
+        graph = Graph.from_directory(tiny, parallel=False)
+        ours, theirs = socket.socketpair()
+        executor = graph.process_executor(max_workers=1, close_fds=[theirs.fileno()])
+        try:
+            # The end is only really closed if the worker closed its inherited copy too
+            theirs.close()
+            ours.settimeout(5)
+            assert ours.recv(1) == b""
+        finally:
+            executor.shutdown()
+            ours.close()
+
+    @pytest.mark.skipif(not graph_module.can_fork(), reason="needs fork")
+    def test_process_executor_freezes_only_workers(self, tiny):
+        graph = Graph.from_directory(tiny, parallel=False)
+        executor = graph.process_executor(max_workers=1)
+        try:
+            assert gc.get_freeze_count() == 0
+            assert executor.submit(gc.get_freeze_count).result() > 0
+        finally:
+            executor.shutdown()
@@ -0,0 +1,67 @@
+import csv
+
+import pytest
+
+from src.cs50_intro_to_ai_with_python.degrees import ingest
+from tests.degrees import SMALL
+
+
+def dict_reader_load(directory):
+    """The original csv.DictReader loader, kept as the reference."""
+    names, people, movies = {}, {}, {}
+    with open(f"{directory}/people.csv", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            people[row["id"]] = {
+                "name": row["name"],
+                "birth": row["birth"],
+                "movies": set(),
+            }
+            names.setdefault(row["name"].lower(), set()).add(row["id"])
+    with open(f"{directory}/movies.csv", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            movies[row["id"]] = {
+                "title": row["title"],
+                "year": row["year"],
+                "stars": set(),
+            }
+    with open(f"{directory}/stars.csv", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            try:
+                people[row["person_id"]]["movies"].add(row["movie_id"])
+                movies[row["movie_id"]]["stars"].add(row["person_id"])
+            except KeyError:
+                pass
+    return names, people, movies
+
+
+class TestIngest:
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_matches_dict_reader(self, parallel):
+        names, people, movies = {}, {}, {}
+        ingest.read_directory(SMALL, people, names, movies, parallel=parallel)
+        assert (names, people, movies) == dict_reader_load(SMALL)
+
+    def test_progress(self):
+        reports = []
+        ingest.read_directory(
+            SMALL,
+            {},
+            {},
+            {},
+            progress=lambda *report: reports.append(report),
+            parallel=False,
+        )
+        assert [(filename, rows) for filename, rows, _ in reports] == [
+            ("people.csv", 16),
+            ("movies.csv", 5),
+            ("stars.csv", 20),
+        ]
+
+    def test_skips_credits_for_unknown_ids(self, tmp_path):
+        (tmp_path / "people.csv").write_text('id,name,birth\n1,"A",1900\n')
+        (tmp_path / "movies.csv").write_text('id,title,year\n10,"M",2000\n')
+        (tmp_path / "stars.csv").write_text("person_id,movie_id\n1,10\n2,10\n1,11\n")
+        people, names, movies = {}, {}, {}
+        ingest.read_directory(tmp_path, people, names, movies, parallel=False)
+        assert people["1"]["movies"] == {"10"}
+        assert movies["10"]["stars"] == {"1"}
@@ -0,0 +1,89 @@
+import math
+import shutil
+
+import pytest
+
+from src.cs50_intro_to_ai_with_python.degrees import degrees, landmarks
+from src.cs50_intro_to_ai_with_python.degrees.graph import Graph
+from tests.degrees import SMALL
+
+KEVIN_BACON = "102"
+CARY_ELWES = "144"
+EMMA_WATSON = "914612"
+
+
+class TestLandmarks:
+    @pytest.fixture
+    def index(self):
+        degrees.load_data(SMALL)
+        return landmarks.build(degrees.people, degrees.movies, count=3)
+
+    def test_lower_bound_never_exceeds_distance(self, index):
+        for source in degrees.people:
+            for target in degrees.people:
+                path = degrees.shortest_paths(source, {target})[target]
+                bound = index.lower_bound(source, target)
+                if path is None:
+                    assert bound == math.inf or source == target
+                else:
+                    assert bound <= len(path)
+
+    def test_lower_bound_detects_disconnected_people(self, index):
+        assert index.lower_bound(KEVIN_BACON, EMMA_WATSON) == math.inf
+        assert index.at_least(KEVIN_BACON, EMMA_WATSON, 6)
+
+    def test_astar_matches_bfs(self, index):
+        for source in degrees.people:
+            for target in degrees.people:
+                expected = degrees.shortest_paths(source, {target})[target]
+                path = landmarks.shortest_path(
+                    source, target, degrees.people, degrees.movies, index
+                )
+                if expected is None:
+                    assert path is None
+                else:
+                    assert len(path) == len(expected)
+
+    def test_save_and_load(self, index, tmp_path):
+        index.save(tmp_path)
+        loaded = landmarks.load(tmp_path)
+        assert loaded.landmarks == index.landmarks
+        assert loaded.person_ids == index.person_ids
+        assert loaded.distances == index.distances
+
+    def test_load_data_uses_persisted_index(self, index, tmp_path):
+        directory = tmp_path / "small"
+        shutil.copytree(SMALL, directory)
+        assert landmarks.load(directory) is None
+        index.save(directory)
+        degrees.load_data(directory)
+        try:
+            assert degrees.graph.landmark_index is not None
+            assert len(degrees.shortest_path(KEVIN_BACON, CARY_ELWES)) == 3
+            assert degrees.degrees_lower_bound(KEVIN_BACON, EMMA_WATSON) == math.inf
+        finally:
+            degrees.load_data(SMALL)
+
+    def test_shortest_path_does_not_need_index(self, index, tmp_path):
+        directory = tmp_path / "small"
+        shutil.copytree(SMALL, directory)
+        index.save(directory)
+        graph = Graph.from_directory(directory, parallel=False)
+        assert graph.landmark_index is not None
+        assert graph.shortest_path(KEVIN_BACON, CARY_ELWES) == Graph.from_directory(
+            SMALL, parallel=False
+        ).shortest_path(KEVIN_BACON, CARY_ELWES)
+
+    def test_stale_index_is_ignored(self, index, tmp_path):
+        directory = tmp_path / "small"
+        shutil.copytree(SMALL, directory)
+        index.save(directory)
+        with open(directory / "people.csv", "a", encoding="utf-8") as f:
+            f.write('999,"Someone New",1990\n')
+        assert landmarks.load(directory) is None
+        assert Graph.from_directory(directory, parallel=False).landmark_index is None
+
+    def test_index_for_other_people_is_ignored(self, index, tmp_path):
+        index.save(tmp_path)
+        assert landmarks.load(tmp_path, person_count=len(index.person_ids)) is not None
+        assert landmarks.load(tmp_path, person_count=len(index.person_ids) + 1) is None
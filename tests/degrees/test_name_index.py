@@ -0,0 +1,63 @@
+from src.cs50_intro_to_ai_with_python.degrees import degrees, name_index
+from src.cs50_intro_to_ai_with_python.degrees.name_index import (
+    NameIndex,
+    edit_distance,
+)
+from tests.degrees import SMALL
+
+NAMES = ["kevin bacon", "kevin costner", "tom hanks", "tom cruise", "cary elwes"]
+
+
+class TestNameIndex:
+    def test_prefix(self):
+        index = NameIndex(NAMES)
+        assert index.prefix("kevin") == ["kevin bacon", "kevin costner"]
+        assert index.prefix("Tom C") == ["tom cruise"]
+        assert index.prefix("zzz") == []
+        assert index.prefix("kevin", limit=1) == ["kevin bacon"]
+
+    def test_fuzzy(self):
+        index = NameIndex(NAMES)
+        assert index.fuzzy("kevn bacon")[0] == (1, "kevin bacon")
+        assert index.fuzzy("tom hnaks")[0] == (2, "tom hanks")
+        assert index.fuzzy("someone else entirely") == []
+
+    def test_fuzzy_reads_at_most_scan_budget_positions(self, monkeypatch):
+        index = NameIndex([f"kevin bacon {n}" for n in range(20)] + ["kevin bacon"])
+        # Every trigram of the query is in all 21 names, so only the first names of the rarest list are read
+        monkeypatch.setattr(name_index, "SCAN_BUDGET", 3)
+        assert [name for _, name in index.fuzzy("kevin bacon")] == [
+            "kevin bacon 0",
+            "kevin bacon 1",
+            "kevin bacon 2",
+        ]
+        monkeypatch.setattr(name_index, "SCAN_BUDGET", 100)
+        assert index.fuzzy("kevin bacon")[0] == (0, "kevin bacon")
+
+    def test_search_ranks_exact_then_prefix_then_fuzzy(self):
+        index = NameIndex(NAMES + ["tom hanks jr"])
+        assert index.search("tom hanks") == ["tom hanks", "tom hanks jr"]
+        assert index.search("cary elwe") == ["cary elwes"]
+
+    def test_add_keeps_prefix_order(self):
+        index = NameIndex(NAMES)
+        index.add("kevin a")
+        index.add("kevin a")
+        assert len(index) == len(NAMES) + 1
+        assert index.prefix("kevin") == ["kevin a", "kevin bacon", "kevin costner"]
+
+    def test_edit_distance(self):
+        assert edit_distance("kitten", "sitting", 5) == 3
+        assert edit_distance("kitten", "sitting", 2) == 3
+        assert edit_distance("a", "abcdef", 2) == 3
+        assert edit_distance("abcdef", "a", 2) == 3
+        assert edit_distance("kevin bacon", "kevn bcaon", 3) == 3
+        assert edit_distance("", "ab", 2) == 2
+
+
+class TestPersonCandidates:
+    def test_person_candidates(self):
+        degrees.load_data(SMALL)
+        assert degrees.person_candidates("Kevin Bacon") == ["102"]
+        assert degrees.person_candidates("tom", limit=2) == ["129", "158"]
+        assert degrees.person_candidates("Emma Watsn") == ["914612"]
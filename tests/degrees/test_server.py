@@ -0,0 +1,179 @@
+import asyncio
+import concurrent.futures
+import json
+
+import pytest
+
+from src.cs50_intro_to_ai_with_python.degrees.client import DegreesClient
+from src.cs50_intro_to_ai_with_python.degrees.server import local_server
+from tests.degrees import SMALL
+
+
+def run_queries(*requests, executor=None, ordered=False):
+    """
+    Sends requests to a server on the small dataset, all at once or, if ordered, each after the last is answered.
+    """
+
+    async def run():
+        async with local_server(SMALL, executor=executor) as server:
+            host, port = server.address[:2]
+            client = await DegreesClient.connect(host=host, port=port)
+            try:
+                if ordered:
+                    return [
+                        await client.request(op, **fields) for op, fields in requests
+                    ]
+                return await asyncio.gather(
+                    *(client.request(op, **fields) for op, fields in requests)
+                )
+            finally:
+                await client.close()
+
+    return asyncio.run(run())
+
+
+class TestServer:
+    @pytest.fixture
+    def executor(self):
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            yield executor
+
+    def test_shortest_path(self, executor):
+        (response,) = run_queries(
+            ("shortest_path", {"source": "Kevin Bacon", "target": "163"}),
+            executor=executor,
+        )
+        assert response["degrees"] == 2
+        assert response["path"][-1] == {"movie_id": "95953", "person_id": "163"}
+
+    def test_concurrent_requests(self, executor):
+        responses = run_queries(
+            ("shortest_path", {"source": "Kevin Bacon", "target": "Cary Elwes"}),
+            ("shortest_path", {"source": "Kevin Bacon", "target": "Emma Watson"}),
+            ("person_id_for_name", {"name": "tom hanks"}),
+            ("shortest_path", {"source": "Nobody", "target": "Tom Hanks"}),
+            ("unknown", {}),
+            executor=executor,
+        )
+        assert [response["id"] for response in responses] == [0, 1, 2, 3, 4]
+        assert responses[0]["degrees"] == 3
+        assert responses[1]["path"] is None
+        assert responses[2]["person_ids"] == ["158"]
+        assert responses[3]["error"] == "person not found"
+        assert responses[4]["error"] == "unknown op: unknown"
+
+    def test_invalid_fields(self, executor):
+        responses = run_queries(
+            ("shortest_path", {"source": 5, "target": "Tom Hanks"}),
+            ("shortest_path", {"source": ["x"], "target": "Tom Hanks"}),
+            ("shortest_path", {"source": "Tom Hanks"}),
+            ("person_id_for_name", {"name": [1]}),
+            ("person_id_for_name", {"name": "Kevin Bacon"}),
+            executor=executor,
+        )
+        assert responses[0]["error"] == "field must be a string: source"
+        assert responses[1]["error"] == "field must be a string: source"
+        assert responses[2]["error"] == "missing field: target"
+        assert responses[3]["error"] == "field must be a string: name"
+        assert responses[4]["person_ids"] == ["102"]
+
+    def test_invalid_json(self, executor):
+        async def run():
+            async with local_server(SMALL, executor=executor) as server:
+                host, port = server.address[:2]
+                reader, writer = await asyncio.open_connection(host, port)
+                writer.write(b"not json\n[1]\n")
+                await writer.drain()
+                responses = [json.loads(await reader.readline()) for _ in range(2)]
+                writer.close()
+                await writer.wait_closed()
+                return responses
+
+        responses = asyncio.run(run())
+        assert {response["error"] for response in responses} == {
+            "invalid JSON",
+            "request must be a JSON object",
+        }
+
+    def test_client_fails_pending_requests_on_bad_response(self):
+        async def run():
+            async def reply_garbage(reader, writer):
+                await reader.readline()
+                writer.write(b"not json\n")
+                await writer.drain()
+                writer.close()
+
+            server = await asyncio.start_server(reply_garbage, "127.0.0.1", 0)
+            async with server:
+                host, port = server.sockets[0].getsockname()[:2]
+                client = await DegreesClient.connect(host=host, port=port)
+                try:
+                    with pytest.raises(ConnectionError):
+                        await client.person_id_for_name("Kevin Bacon")
+                finally:
+                    await client.close()
+
+        asyncio.run(run())
+
+    def test_search_names(self, executor):
+        responses = run_queries(
+            ("search_names", {"query": "tom", "limit": 2}),
+            ("search_names", {"query": "Kevn Bacon"}),
+            ("search_names", {"query": "tom", "limit": 0}),
+            ("shortest_path", {"source": "Kevin Bacon", "target": "Tom Hank"}),
+            executor=executor,
+        )
+        assert [c["name"] for c in responses[0]["candidates"]] == [
+            "Tom Cruise",
+            "Tom Hanks",
+        ]
+        assert responses[1]["candidates"][0]["person_id"] == "102"
+        assert "limit" in responses[2]["error"]
+        assert responses[3]["error"] == "person not found"
+        assert responses[3]["candidates"][0]["person_id"] == "158"
+
+    def test_apply_delta(self, executor, tmp_path):
+        (tmp_path / "stars.csv").write_text("person_id,movie_id\n914612,104257\n")
+        responses = run_queries(
+            ("shortest_path", {"source": "Kevin Bacon", "target": "Emma Watson"}),
+            ("apply_delta", {"directory": str(tmp_path)}),
+            ("shortest_path", {"source": "Kevin Bacon", "target": "Emma Watson"}),
+            ("apply_delta", {"directory": str(tmp_path / "missing")}),
+            executor=executor,
+            ordered=True,
+        )
+        assert responses[0]["path"] is None
+        assert responses[1]["applied"] == {"people": 0, "movies": 0, "credits": 1}
+        assert responses[2]["degrees"] == 1
+        assert responses[3]["error"].startswith("not a directory")
+
+    def test_apply_delta_forks_new_workers(self, tmp_path):
+        (tmp_path / "stars.csv").write_text("person_id,movie_id\n914612,104257\n")
+
+        # Requests are handed to the server directly: a client in this process would have its socket inherited by
+        # the new workers, which only close the server's own sockets
+        async def run():
+            async with local_server(SMALL) as server:
+                applied = await server.handle_request(
+                    json.dumps({"op": "apply_delta", "directory": str(tmp_path)})
+                )
+                path = await server.handle_request(
+                    json.dumps(
+                        {"op": "shortest_path", "source": "102", "target": "914612"}
+                    )
+                )
+                return applied, path
+
+        applied, path = asyncio.run(run())
+        assert applied["applied"]["credits"] == 1
+        assert path["degrees"] == 1
+
+    def test_process_pool(self):
+        path, names, unresolved = run_queries(
+            ("shortest_path", {"source": "Tom Hanks", "target": "Kevin Bacon"}),
+            ("search_names", {"query": "Kevn Bacon"}),
+            ("shortest_path", {"source": "Tom Hank", "target": "Kevin Bacon"}),
+        )
+        assert path["degrees"] == 1
+        assert names["candidates"][0]["person_id"] == "102"
+        assert unresolved["candidates"][0]["person_id"] == "158"
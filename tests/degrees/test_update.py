@@ -0,0 +1,96 @@
+import shutil
+
+import pytest
+
+from src.cs50_intro_to_ai_with_python.degrees import degrees, landmarks, update
+from tests.degrees import SMALL
+
+KEVIN_BACON = "102"
+TOM_HANKS = "158"
+EMMA_WATSON = "914612"
+
+
+@pytest.fixture
+def delta(tmp_path):
+    directory = tmp_path / "delta"
+    directory.mkdir()
+    (directory / "people.csv").write_text(
+        'id,name,birth\n1,"Daniel Radcliffe",1989\n158,"Thomas Hanks",1956\n'
+    )
+    (directory / "movies.csv").write_text(
+        'id,title,year\n241527,"Harry Potter and the Sorcerer\'s Stone",2001\n'
+    )
+    (directory / "stars.csv").write_text(
+        "person_id,movie_id\n1,241527\n914612,241527\n1,109830\n999,241527\n"
+    )
+    return directory
+
+
+class TestUpdate:
+    @pytest.fixture(autouse=True)
+    def small(self, tmp_path):
+        dataset = tmp_path / "small"
+        shutil.copytree(SMALL, dataset)
+        degrees.load_data(dataset)
+        yield dataset
+        degrees.names.clear()
+        degrees.people.clear()
+        degrees.movies.clear()
+        degrees.load_data(SMALL)
+
+    def test_apply_delta(self, delta):
+        degrees.neighbors_for_person(TOM_HANKS)
+        assert not degrees.connected(KEVIN_BACON, EMMA_WATSON)
+
+        counts = update.apply_delta(degrees.graph, delta)
+
+        assert counts == {"people": 2, "movies": 1, "credits": 3}
+        assert degrees.person_ids_for_name("Daniel Radcliffe") == ["1"]
+        assert degrees.person_ids_for_name("Thomas Hanks") == [TOM_HANKS]
+        assert degrees.person_ids_for_name("Tom Hanks") == []
+        assert "tom hanks" not in degrees.names
+        assert "tom hanks" not in degrees.graph.name_index.search("tom hanks")
+        assert "thomas hanks" in degrees.graph.name_index.search("thomas")
+        assert ("109830", "1") in degrees.neighbors_for_person(TOM_HANKS)
+        assert degrees.connected(KEVIN_BACON, EMMA_WATSON)
+        assert len(degrees.shortest_path(KEVIN_BACON, EMMA_WATSON)) == 3
+
+    def test_apply_delta_updates_built_name_index(self, delta):
+        degrees.graph.build_name_index()
+        update.apply_delta(degrees.graph, delta)
+        assert "tom hanks" not in degrees.graph.name_index.search("tom hanks")
+        assert "thomas hanks" in degrees.graph.name_index.search("thomas")
+        assert "daniel radcliffe" in degrees.graph.name_index.search("danel radclife")
+
+    def test_apply_delta_updates_landmark_index(self, delta):
+        index = landmarks.build(degrees.people, degrees.movies, count=3)
+        degrees.graph.landmark_index = index
+        update.apply_delta(degrees.graph, delta)
+        for landmark, distances in zip(index.landmarks, index.distances):
+            assert distances == landmarks.distances_from(
+                landmark, degrees.people, degrees.movies, index.positions
+            )
+
+    def test_append_to_dataset_matches_applied_delta(self, small, delta):
+        update.apply_delta(degrees.graph, delta)
+        applied = (dict(degrees.names), dict(degrees.people), dict(degrees.movies))
+        update.append_to_dataset(small, delta)
+
+        degrees.names.clear()
+        degrees.people.clear()
+        degrees.movies.clear()
+        degrees.load_data(small)
+        assert degrees.names == applied[0]
+        assert degrees.people == applied[1]
+        assert degrees.movies == applied[2]
+
+    def test_append_to_dataset_counts_rows(self, small, delta):
+        counts = update.append_to_dataset(small, delta)
+        assert counts == {"people.csv": 2, "movies.csv": 1, "stars.csv": 4}
+
+    def test_append_to_dataset_rejects_reordered_columns(self, small, delta):
+        (delta / "people.csv").write_text('name,id,birth\n"Daniel Radcliffe",1,1989\n')
+        before = {path.name: path.read_bytes() for path in small.glob("*.csv")}
+        with pytest.raises(ValueError, match="people.csv"):
+            update.append_to_dataset(small, delta)
+        assert {path.name: path.read_bytes() for path in small.glob("*.csv")} == before
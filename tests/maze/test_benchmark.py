@@ -0,0 +1,15 @@
+from src.cs50_intro_to_ai_with_python.maze import benchmark
+
+
+class TestBenchmark:
+    def test_measure_import(self):
+        report = benchmark.measure_import(runs=1)
+        assert report["median_seconds"] > 0
+        assert not report["pil_imported"]
+        assert not report["logging_configured"]
+
+    def test_measure_solve(self):
+        report = benchmark.measure_solve("tests/test_files/maze1.txt", runs=2)
+        assert report["maze"] == "maze1.txt"
+        assert report["solution_length"] > 0
+        assert report["states_explored"] >= report["solution_length"]
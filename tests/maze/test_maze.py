@@ -1,5 +1,7 @@
 import pytest
 import io
+import subprocess
+import sys
 from src.cs50_intro_to_ai_with_python.maze.error_messages import (
     EXACTLY_ONE_START_POINT,
     EXACTLY_ONE_GOAL,
@@ -22,7 +24,7 @@ class TestMaze:
         assert maze.goal == (0, 5)
 
     def test_maze_solves_correctly(self, maze):
-        maze.solve()
+        maze.solve(animate=False)
         solution_actions, solution_cells = maze.solution
         assert solution_actions[0] == UP
         assert solution_cells[0] == (8, 0)
@@ -92,7 +94,7 @@ class TestMaze:
         monkeypatch.setattr("builtins.open", lambda x, y="r": io.StringIO(complex_maze))
         maze = Maze(complex_maze)
         # maze.print()
-        maze.solve()
+        maze.solve(animate=False)
         # maze.print()
         assert maze.solution is not None
 
@@ -171,6 +173,28 @@ class TestMaze:
         maze.solve()
         assert maze.solution is not None
 
+    def test_animated_and_silent_solutions_match(self, maze, capsys, monkeypatch):
+        monkeypatch.setattr("time.sleep", lambda seconds: None)
+        maze.solve(animate=False)
+        silent = (maze.solution, maze.num_of_states_explored)
+        assert capsys.readouterr().out == ""
+        maze.solve()
+        assert (maze.solution, maze.num_of_states_explored) == silent
+
+    def test_import_does_not_configure_logging_or_load_pil(self):
+        code = (
+            "import logging, sys;"
+            "import src.cs50_intro_to_ai_with_python.maze.maze;"
+            "assert not logging.getLogger().handlers;"
+            "assert 'PIL' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_output_image(self, maze, tmp_path):
+        maze.solve(animate=False)
+        maze.output_image(tmp_path / "maze.png", show_explored=True)
+        assert (tmp_path / "maze.png").stat().st_size > 0
+
     def test_maze_neighbors_exists(self, monkeypatch):
         monkeypatch.setattr("builtins.open", lambda x, y="r": io.StringIO("A  B"))
         maze = Maze("../test_files/maze1.txt")
@@ -0,0 +1,112 @@
+import pytest
+
+from src.cs50_intro_to_ai_with_python import search
+
+# An undirected graph with two routes from a to f, of lengths 3 and 4, and an unreachable g
+EDGES = {
+    "a": ["b", "c"],
+    "b": ["a", "d"],
+    "c": ["a", "e"],
+    "d": ["b", "f"],
+    "e": ["c", "h"],
+    "h": ["e", "f"],
+    "f": ["d", "h"],
+    "g": [],
+}
+
+
+def neighbors(state):
+    return [(f"{state}-{next_state}", next_state) for next_state in EDGES[state]]
+
+
+def reverse_neighbors(state):
+    return [(f"{previous}-{state}", previous) for previous in EDGES[state]]
+
+
+def undirected_neighbors(state):
+    return [
+        ("".join(sorted(state + next_state)), next_state) for next_state in EDGES[state]
+    ]
+
+
+def states(steps):
+    return [state for _, state in steps]
+
+
+class TestEngines:
+    def test_breadth_first_finds_shortest_path(self):
+        node = search.breadth_first("a", lambda state: state == "f", neighbors)
+        assert search.path_to(node) == [("a-b", "b"), ("b-d", "d"), ("d-f", "f")]
+
+    def test_breadth_first_goals_nearest_first(self):
+        goals = search.breadth_first_goals("a", {"d", "e", "f"}.__contains__, neighbors)
+        assert [node.state for node in goals] == ["d", "e", "f"]
+
+    def test_depth_first_finds_a_path(self):
+        node = search.depth_first("a", lambda state: state == "f", neighbors)
+        assert states(search.path_to(node))[-1] == "f"
+
+    def test_unreachable_goal(self):
+        assert search.breadth_first("a", lambda state: state == "g", neighbors) is None
+        assert search.depth_first("a", lambda state: state == "g", neighbors) is None
+        assert search.best_first("a", lambda state: state == "g", neighbors) is None
+        assert search.bidirectional("a", "g", neighbors) is None
+
+    def test_best_first_with_heuristic(self):
+        remaining = {"a": 3, "b": 2, "c": 3, "d": 1, "e": 2, "h": 1, "f": 0, "g": 0}
+        node = search.best_first(
+            "a", lambda state: state == "f", neighbors, heuristic=remaining.get
+        )
+        assert states(search.path_to(node)) == ["b", "d", "f"]
+
+    def test_best_first_with_costs(self):
+        # Make the longer route cheaper
+        def cost(state, action, next_state):
+            return 10 if action in ("b-d", "d-b") else 1
+
+        node = search.best_first("a", lambda state: state == "f", neighbors, cost=cost)
+        assert states(search.path_to(node)) == ["c", "e", "h", "f"]
+
+    @pytest.mark.parametrize("goal", ["a", "b", "e", "f"])
+    def test_bidirectional_matches_breadth_first(self, goal):
+        node = search.breadth_first("a", lambda state: state == goal, neighbors)
+        steps = search.bidirectional("a", goal, neighbors, reverse_neighbors)
+        assert len(steps) == len(search.path_to(node))
+        previous = "a"
+        for action, state in steps:
+            assert (action, state) in neighbors(previous)
+            previous = state
+        assert previous == goal
+
+    def test_bidirectional_defaults_to_symmetric_neighbors(self):
+        steps = search.bidirectional("a", "f", undirected_neighbors)
+        assert steps == [("ab", "b"), ("bd", "d"), ("df", "f")]
+
+    def test_on_expand_sees_every_expansion(self):
+        expanded = []
+        search.breadth_first(
+            "a", lambda state: state == "g", neighbors, on_expand=expanded.append
+        )
+        assert sorted(node.state for node in expanded) == [
+            "a",
+            "b",
+            "c",
+            "d",
+            "e",
+            "f",
+            "h",
+        ]
+
+
+class TestFrontiers:
+    def test_stack_frontier_is_last_in_first_out(self):
+        frontier = search.StackFrontier()
+        for state in range(3):
+            frontier.add(search.Node(state=state, parent=None, action=None))
+        assert frontier.contains_state(2)
+        assert [frontier.remove().state for _ in range(3)] == [2, 1, 0]
+        assert not frontier.contains_state(2)
+
+    def test_remove_from_empty_frontier(self):
+        with pytest.raises(Exception, match=search.EMPTY_FRONTIER):
+            search.QueueFrontier().remove()
@@ -0,0 +1,51 @@
+import json
+import random
+
+import pytest
+
+from src.cs50_intro_to_ai_with_python.tictactoe import benchmark
+from src.cs50_intro_to_ai_with_python.tictactoe import tictactoe as ttt
+
+
+class TestBenchmark:
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        yield
+        ttt.configure()
+
+    def test_engine_never_loses_tictactoe(self):
+        report = benchmark.run(games=6, seed=1)
+        engine_vs_engine = report["matches"]["engine_vs_engine"]
+        assert engine_vs_engine["results"] == {"X": 0, "O": 0, "tie": 6}
+        assert report["matches"]["engine_vs_random"]["engine_losses"] == 0
+
+    def test_report_is_json(self):
+        report = benchmark.run(games=2, seed=1, random_openings=2)
+        summary = json.loads(json.dumps(report))["matches"]["engine_vs_random"]
+        assert summary["engine_moves"] > 0
+        assert summary["nodes_per_second"] > 0
+        assert 0 <= summary["table_hit_rate"] <= 1
+        assert len(summary["games"]) == 2
+
+    def test_searches_without_the_solved_table(self):
+        ttt.configure(solved_table=False)
+        report = benchmark.run(games=2, seed=1, clear_table=True)
+        engine_vs_engine = report["matches"]["engine_vs_engine"]
+        assert engine_vs_engine["results"]["tie"] == 2
+        # Lookups count one node per move; searches from an empty table many more
+        assert engine_vs_engine["nodes"] > 10 * engine_vs_engine["engine_moves"]
+        assert report["matches"]["engine_vs_random"]["engine_losses"] == 0
+
+    def test_games_are_seeded(self):
+        first = benchmark.run(games=3, seed=7, random_openings=2)
+        second = benchmark.run(games=3, seed=7, random_openings=2)
+        for name in first["matches"]:
+            assert first["matches"][name]["games"] == second["matches"][name]["games"]
+
+    def test_records_search_stats_on_larger_boards(self):
+        ttt.configure(4, 4, 4, time_limit=0.05)
+        game = benchmark.play(
+            {ttt.X: benchmark.ENGINE, ttt.O: benchmark.RANDOM}, random.Random(0)
+        )
+        assert game["engine_moves"]
+        assert all(move["nodes"] > 0 for move in game["engine_moves"])
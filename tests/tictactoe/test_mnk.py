@@ -0,0 +1,142 @@
+import concurrent.futures
+import math
+import time
+
+import pytest
+
+from src.cs50_intro_to_ai_with_python.tictactoe import mnk
+from src.cs50_intro_to_ai_with_python.tictactoe import tictactoe as ttt
+from src.cs50_intro_to_ai_with_python.tictactoe.mnk import EMPTY, O, X
+
+
+def board_from(rows):
+    return [[{"X": X, "O": O, ".": EMPTY}[cell] for cell in row] for row in rows]
+
+
+class TestGame:
+    @pytest.mark.parametrize(
+        "m, n, k, lines", [(3, 3, 3, 8), (4, 4, 4, 10), (5, 5, 4, 28), (3, 5, 3, 20)]
+    )
+    def test_lines(self, m, n, k, lines):
+        assert len(mnk.Game(m, n, k).lines) == lines
+
+    @pytest.mark.parametrize("m, n, k", [(0, 3, 3), (3, 3, 4), (3, 3, 0)])
+    def test_rejects_invalid_games(self, m, n, k):
+        with pytest.raises(ValueError):
+            mnk.Game(m, n, k)
+
+    def test_winner(self):
+        game = mnk.Game(5, 5, 4)
+        board = board_from(["X....", ".XO..", "..XO.", "...XO", "....."])
+        assert game.winner(board) == X
+        assert game.terminal(board)
+        assert game.utility(board) == 1
+
+    def test_no_winner_with_k_minus_one_in_a_row(self):
+        game = mnk.Game(4, 4, 4)
+        board = board_from(["XXX.", "OOO.", "....", "...."])
+        assert game.winner(board) is None
+        assert not game.terminal(board)
+        assert game.player(board) == X
+
+    def test_result(self):
+        game = mnk.Game(4, 5, 4)
+        board = game.result(game.initial_state(), (3, 4))
+        assert board[3][4] == X
+        assert len(game.actions(board)) == 19
+        with pytest.raises(ValueError):
+            game.result(board, (3, 4))
+
+    def test_evaluate_keeps_quiet_positions_below_forced_values(self):
+        game = mnk.Game(10, 10, 8)
+        # Two rows of six stones, each in three open lines, but no line one stone short of a win
+        me = sum(1 << game.index(i, j) for i in (0, 2) for j in range(2, 8))
+        them = sum(1 << game.index(9, j) for j in range(0, 10, 2))
+        assert game.evaluate(me, them) == game.max_score
+        assert game.evaluate(them, me) == -game.max_score
+        assert not mnk.Search(game).forced(game.evaluate(me, them))
+
+    def test_hash_xors_stone_keys(self):
+        game = mnk.Game(4, 4, 4)
+        assert game.hash_bits(0b1, 0b10) == game.zobrist[0][0] ^ game.zobrist[1][1]
+
+
+class TestSearch:
+    def test_takes_win(self):
+        game = mnk.Game(5, 5, 4)
+        board = board_from([".....", ".XXX.", ".OO..", "..O..", "....."])
+        assert mnk.Search(game, time_limit=1).minimax(board) in {(1, 0), (1, 4)}
+
+    def test_blocks_win(self):
+        game = mnk.Game(5, 5, 4)
+        board = board_from([".....", "OXXX.", ".O...", ".....", "....."])
+        assert game.player(board) == O
+        assert mnk.Search(game, time_limit=1).minimax(board) == (1, 4)
+
+    def test_perfect_play_on_3x3_is_a_tie(self):
+        game = mnk.Game(3, 3, 3)
+        search = mnk.Search(game, time_limit=5)
+        board = game.initial_state()
+        while not game.terminal(board):
+            board = game.result(board, search.minimax(board))
+        assert game.winner(board) is None
+
+    def test_keeps_to_time_limit(self):
+        game = mnk.Game(9, 9, 5)
+        search = mnk.Search(game, time_limit=0.2)
+        board = game.result(game.initial_state(), (4, 4))
+        start = time.perf_counter()
+        assert search.minimax(board) in game.actions(board)
+        assert time.perf_counter() - start < 1
+        assert search.depth >= 1
+        assert search.nodes > 0
+
+    def test_cancel_from_another_thread(self):
+        game = mnk.Game(9, 9, 5)
+        search = mnk.Search(game, time_limit=math.inf)
+        board = game.result(game.initial_state(), (4, 4))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            move = executor.submit(search.minimax, board)
+            time.sleep(0.2)
+            search.cancel()
+            assert move.result(timeout=5) in game.actions(board)
+
+    def test_cancel_before_the_search_starts(self):
+        game = mnk.Game(9, 9, 5)
+        search = mnk.Search(game, time_limit=math.inf)
+        board = game.result(game.initial_state(), (4, 4))
+        search.cancel()
+        start = time.perf_counter()
+        assert search.minimax(board) in game.actions(board)
+        assert time.perf_counter() - start < 1
+        # The cancel only applied to that search
+        assert not search.cancelled
+        search.max_depth = 2
+        search.minimax(board)
+        assert search.depth == 2
+
+    def test_terminal_board_has_no_move(self):
+        game = mnk.Game(4, 4, 4)
+        board = board_from(["XXXX", "OOO.", "....", "...."])
+        assert mnk.Search(game).minimax(board) is None
+
+
+class TestConfigure:
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        yield
+        ttt.configure()
+
+    def test_configured_functions_play_larger_boards(self):
+        ttt.configure(4, 4, 4, time_limit=0.2)
+        board = ttt.initial_state()
+        assert len(board) == 4 and len(board[0]) == 4
+        board = ttt.result(board, ttt.minimax(board))
+        assert ttt.player(board) == O
+        assert len(ttt.actions(board)) == 15
+        assert not ttt.terminal(board)
+
+    def test_default_configuration_is_classic_tictactoe(self):
+        ttt.configure(4, 4, 4)
+        ttt.configure()
+        assert ttt.initial_state() == [[EMPTY] * 3 for _ in range(3)]
@@ -0,0 +1,105 @@
+import concurrent.futures
+import math
+import time
+
+import pytest
+
+from src.cs50_intro_to_ai_with_python.tictactoe import mnk, parallel
+from src.cs50_intro_to_ai_with_python.tictactoe import tictactoe as ttt
+
+
+@pytest.fixture
+def game():
+    return mnk.Game(5, 5, 4)
+
+
+def opening(game, moves):
+    board = game.initial_state()
+    for move in moves:
+        board = game.result(board, move)
+    return board
+
+
+class TestParallelSearch:
+    @pytest.mark.parametrize(
+        "moves", [[(2, 2)], [(2, 2), (1, 1)], [(2, 2), (1, 2), (3, 3), (0, 0)]]
+    )
+    def test_same_move_as_sequential_search(self, game, moves):
+        report = parallel.compare(game, opening(game, moves), depth=3, processes=2)
+        assert report["same_move"]
+        assert sum(report["worker_nodes"]) == report["parallel_nodes"]
+        assert report["parallel_nodes"] > 0
+
+    def test_out_of_time_plays_a_legal_move(self, game):
+        search = parallel.ParallelSearch(game, processes=2, time_limit=0)
+        board = opening(game, [(2, 2)])
+        try:
+            move = search.minimax(board)
+        finally:
+            search.close()
+        assert move in game.actions(board)
+
+    def test_cancel_from_another_thread(self):
+        game = mnk.Game(9, 9, 5)
+        search = parallel.ParallelSearch(game, processes=2, time_limit=math.inf)
+        board = opening(game, [(4, 4)])
+        search.start_workers()
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                move = executor.submit(search.minimax, board)
+                time.sleep(0.5)
+                search.cancel()
+                assert move.result(timeout=5) in game.actions(board)
+        finally:
+            search.close()
+
+    def test_cancelled_tasks_do_not_hold_up_the_next_search(self):
+        game = mnk.Game(9, 9, 5)
+        search = parallel.ParallelSearch(game, processes=2, time_limit=math.inf)
+        board = opening(game, [(4, 4)])
+        search.start_workers()
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                move = executor.submit(search.minimax, board)
+                time.sleep(0.5)
+                search.cancel()
+                assert move.result(timeout=5) in game.actions(board)
+                # Tasks of the cancelled search left in the pool would otherwise run until its deadline, which
+                # never comes
+                search.search.max_depth = 1
+                move = executor.submit(search.minimax, board)
+                assert move.result(timeout=5) in game.actions(board)
+                assert search.depth == 1
+        finally:
+            search.close()
+
+    def test_cancel_before_the_search_starts(self, game):
+        search = parallel.ParallelSearch(game, processes=2, time_limit=math.inf)
+        board = opening(game, [(2, 2)])
+        try:
+            search.cancel()
+            assert search.minimax(board) in game.actions(board)
+            assert search.depth == 0
+            search.search.max_depth = 2
+            search.minimax(board)
+            assert search.depth == 2
+        finally:
+            search.close()
+
+    def test_terminal_board_has_no_move(self, game):
+        search = parallel.ParallelSearch(game, processes=2, time_limit=math.inf)
+        board = opening(game, [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2), (1, 2), (0, 3)])
+        assert search.minimax(board) is None
+        assert search.pool is None
+
+
+class TestConfigure:
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        yield
+        ttt.configure()
+
+    def test_minimax_searches_in_parallel(self):
+        ttt.configure(5, 5, 4, time_limit=0.2, processes=2)
+        board = ttt.result(ttt.initial_state(), (2, 2))
+        assert ttt.minimax(board) in ttt.actions(board)
@@ -0,0 +1,156 @@
+import pytest
+
+from src.cs50_intro_to_ai_with_python.tictactoe import tictactoe as ttt
+from src.cs50_intro_to_ai_with_python.tictactoe.tictactoe import EMPTY, O, X
+
+
+# Memoised, since every position is checked
+plain_values = {}
+
+
+def plain_value(board):
+    """
+    Minimax value without pruning, to check the optimised search against.
+    """
+    key = tuple(tuple(row) for row in board)
+    if key not in plain_values:
+        if ttt.terminal(board):
+            plain_values[key] = ttt.utility(board)
+        else:
+            children = [
+                plain_value(ttt.result(board, action)) for action in ttt.actions(board)
+            ]
+            plain_values[key] = (
+                max(children) if ttt.player(board) == X else min(children)
+            )
+    return plain_values[key]
+
+
+def positions():
+    """
+    Yields every non-terminal board reachable from the start.
+    """
+    seen = set()
+    stack = [ttt.initial_state()]
+    while stack:
+        board = stack.pop()
+        key = tuple(tuple(row) for row in board)
+        if key in seen or ttt.terminal(board):
+            continue
+        seen.add(key)
+        yield board
+        stack.extend(ttt.result(board, action) for action in ttt.actions(board))
+
+
+class TestRules:
+    def test_initial_player(self):
+        assert ttt.player(ttt.initial_state()) == X
+
+    def test_players_alternate(self):
+        board = ttt.result(ttt.initial_state(), (0, 0))
+        assert board[0][0] == X
+        assert ttt.player(board) == O
+
+    def test_actions(self):
+        board = [[X, O, X], [EMPTY, O, EMPTY], [X, X, O]]
+        assert ttt.actions(board) == {(1, 0), (1, 2)}
+
+    def test_result_does_not_modify_board(self):
+        board = ttt.initial_state()
+        ttt.result(board, (1, 1))
+        assert board == ttt.initial_state()
+
+    @pytest.mark.parametrize("action", [(0, 0), (3, 0), (0, -1)])
+    def test_result_rejects_invalid_actions(self, action):
+        board = [[X, EMPTY, EMPTY], [EMPTY, EMPTY, EMPTY], [EMPTY, EMPTY, EMPTY]]
+        with pytest.raises(ValueError):
+            ttt.result(board, action)
+
+    @pytest.mark.parametrize(
+        "board, expected",
+        [
+            ([[X, X, X], [O, O, EMPTY], [EMPTY, EMPTY, EMPTY]], X),
+            ([[X, O, X], [X, O, EMPTY], [EMPTY, O, EMPTY]], O),
+            ([[O, X, X], [X, O, EMPTY], [EMPTY, X, O]], O),
+            ([[X, X, O], [X, O, EMPTY], [O, EMPTY, EMPTY]], O),
+            ([[X, O, X], [X, O, O], [O, X, X]], None),
+        ],
+    )
+    def test_winner_and_utility(self, board, expected):
+        assert ttt.winner(board) == expected
+        assert ttt.terminal(board)
+        assert ttt.utility(board) == {X: 1, O: -1, None: 0}[expected]
+
+    def test_game_in_progress_is_not_terminal(self):
+        assert not ttt.terminal([[X, O, EMPTY], [EMPTY] * 3, [EMPTY] * 3])
+
+
+class TestMinimax:
+    def test_terminal_board_has_no_move(self):
+        assert ttt.minimax([[X, X, X], [O, O, EMPTY], [EMPTY, EMPTY, EMPTY]]) is None
+
+    def test_takes_win(self):
+        board = [[X, X, EMPTY], [O, O, EMPTY], [EMPTY, EMPTY, EMPTY]]
+        assert ttt.minimax(board) == (0, 2)
+
+    def test_blocks_win(self):
+        board = [[X, X, EMPTY], [EMPTY, O, EMPTY], [EMPTY, EMPTY, EMPTY]]
+        assert ttt.minimax(board) == (0, 2)
+
+    def test_perfect_play_is_a_tie(self):
+        board = ttt.initial_state()
+        while not ttt.terminal(board):
+            board = ttt.result(board, ttt.minimax(board))
+        assert ttt.winner(board) is None
+
+    def test_moves_are_optimal(self):
+        for board in positions():
+            best = plain_value(board)
+            assert plain_value(ttt.result(board, ttt.minimax(board))) == best
+
+
+class TestBitboards:
+    def test_to_bits(self):
+        board = [[X, EMPTY, EMPTY], [EMPTY, O, EMPTY], [EMPTY, EMPTY, X]]
+        assert ttt.to_bits(board) == (0b100000001, 0b000010000)
+
+    @pytest.mark.parametrize("line", ttt.LINES)
+    def test_every_line_wins(self, line):
+        board = [
+            [O if line & ttt.CELL_BITS[i, j] else EMPTY for j in range(3)]
+            for i in range(3)
+        ]
+        assert ttt.winner(board) == O
+        assert ttt.terminal(board)
+
+
+class TestSolvedPositions:
+    def test_table_covers_every_canonical_position(self):
+        assert len(ttt.solved_positions()) == 765
+
+    def test_table_matches_live_search(self):
+        for key, (value, move) in ttt.solved_positions().items():
+            x_bits, o_bits = key & ttt.FULL_BOARD, key >> 9
+            assert ttt.value(x_bits, o_bits) == value
+            if move is None:
+                assert ttt.terminal_bits(x_bits, o_bits)
+                continue
+            bit = 1 << move
+            assert not (x_bits | o_bits) & bit
+            if ttt.player_bits(x_bits, o_bits) == X:
+                assert ttt.value(x_bits | bit, o_bits) == value
+            else:
+                assert ttt.value(x_bits, o_bits | bit) == value
+
+    def test_symmetric_boards_share_a_key(self):
+        board = [[X, EMPTY, EMPTY], [EMPTY, O, EMPTY], [EMPTY, EMPTY, EMPTY]]
+        rotated = [[EMPTY, EMPTY, X], [EMPTY, O, EMPTY], [EMPTY, EMPTY, EMPTY]]
+        assert (
+            ttt.canonical(*ttt.to_bits(board))[0]
+            == ttt.canonical(*ttt.to_bits(rotated))[0]
+        )
+
+    def test_search_without_table(self, monkeypatch):
+        monkeypatch.setattr(ttt, "_solved", {})
+        board = [[X, X, EMPTY], [EMPTY, O, EMPTY], [EMPTY, EMPTY, EMPTY]]
+        assert ttt.minimax(board) == (0, 2)